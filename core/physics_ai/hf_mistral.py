@@ -1,3 +1,5 @@
+from typing import List
+
 from gradio_client import Client
 
 class PhysicsMistral:
@@ -22,3 +24,23 @@ Now solve this:"""
             return response
         except Exception as e:
             return f"Request failed: {e}"
+
+    def analyze_questions(self, questions: List[str]) -> List[str]:
+        """Submit several questions at once and collect the answers in order"""
+        jobs = []
+        for question in questions:
+            try:
+                jobs.append(self.client.submit(f"Question: {question}", api_name="/predict"))
+            except Exception as e:
+                jobs.append(e)
+
+        responses = []
+        for job in jobs:
+            if isinstance(job, Exception):
+                responses.append(f"Request failed: {job}")
+                continue
+            try:
+                responses.append(job.result())
+            except Exception as e:
+                responses.append(f"Request failed: {e}")
+        return responses
@@ -1,7 +1,13 @@
+import functools
 import math
+import threading
+from collections import deque
+from dataclasses import dataclass, fields
 from typing import Dict, Optional, Union, Tuple
 from enum import Enum, auto
 
+import numpy as np
+
 class WaveError(Exception):
     """Base class for wave-related errors"""
     pass
@@ -23,17 +29,87 @@ class UnitSystem(Enum):
     CGS = auto()
     IMPERIAL = auto()
 
+@dataclass(slots=True)
+class WaveState:
+    """Every quantity the wave solver tracks; None means not yet known"""
+    # Wave properties
+    v: Optional[float] = None
+    f: Optional[float] = None
+    λ: Optional[float] = None
+    T: Optional[float] = None
+    k: Optional[float] = None
+    ω: Optional[float] = None
+    # Sound waves
+    f_observed: Optional[float] = None
+    f_source: Optional[float] = None
+    v_source: Optional[float] = None
+    v_observer: Optional[float] = None
+    v_medium: Optional[float] = None
+    θ_source: Optional[float] = None
+    θ_observer: Optional[float] = None
+    # Light properties
+    n1: Optional[float] = None
+    n2: Optional[float] = None
+    θ1: Optional[float] = None
+    θ2: Optional[float] = None
+    I1: Optional[float] = None
+    I2: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, float]:
+        """Known values only, in declaration order"""
+        return {name: value for name in _STATE_FIELDS
+                if (value := getattr(self, name)) is not None}
+
+_STATE_FIELDS = tuple(f.name for f in fields(WaveState))
+
+_TAU = 2 * math.pi
+
+# Tolerance for treating an angle as head-on or a Doppler denominator as zero
+_EPS = 1e-6
+
+# Validation rule sets, built once rather than as list literals per check
+_NON_NEGATIVE = frozenset({'v', 'f', 'λ', 'T', 'ω', 'k',
+                           'f_observed', 'f_source', 'v_source', 'v_observer', 'v_medium',
+                           'n1', 'n2', 'I1', 'I2'})
+_ANGLES = frozenset({'θ_source', 'θ_observer', 'θ1', 'θ2'})
+_FREQUENCIES = frozenset({'f', 'f_observed', 'f_source'})
+_REFRACTIVE_INDICES = frozenset({'n1', 'n2'})
+_VELOCITIES = frozenset({'v_source', 'v_observer'})
+
+def _divide(numerator: float, denominator: float, message: str) -> float:
+    """Divide, raising a configuration error instead of ZeroDivisionError"""
+    if denominator == 0:
+        raise PhysicsConfigurationError(message)
+    return numerator / denominator
+
 class WaveSolver:
     def __init__(self, unit_system: UnitSystem = UnitSystem.SI):
         self.speed_of_sound = 343  # m/s at 20°C
         self.speed_of_light = 3e8  # m/s
         self.unit_system = unit_system
-        self.max_iterations = 20  # Prevent infinite loops in solver
+        self.rules = self._build_rules()
+        # Index equations by each input so a newly solved value only wakes its dependants
+        self._rules_by_input = {}
+        # Quantities that decide which equations can fire, per category
+        self._rule_vars = {}
+        for category, rules in self.rules.items():
+            by_input = self._rules_by_input[category] = {}
+            for rule in rules:
+                for name in rule[0]:
+                    by_input.setdefault(name, []).append(rule)
+            self._rule_vars[category] = frozenset(
+                name for inputs, output, _ in rules for name in (*inputs, output))
+        # Evaluation order per (category, known quantities), built on first use
+        self._plans = {}
 
     def _validate_inputs(self, inputs: Dict[str, float], category: str) -> None:
         """Validate input values for physical feasibility"""
-        # Common validations for all categories
-        for key, value in inputs.items():
+        self._validate_values(inputs)
+        self._validate_relations(inputs, category)
+
+    def _validate_values(self, values: Dict[str, float]) -> None:
+        """Per-value checks (type, sign, range)"""
+        for key, value in values.items():
             if value is None:
                 continue
                 
@@ -41,30 +117,29 @@ class WaveSolver:
                 raise InputValidationError(f"Value for {key} must be a number, got {type(value)}")
                 
             # Check for negative values where not allowed
-            if key in ['v', 'f', 'λ', 'T', 'ω', 'k', 
-                      'f_observed', 'f_source', 'v_source', 'v_observer', 'v_medium',
-                      'n1', 'n2', 'I1', 'I2']:
+            if key in _NON_NEGATIVE:
                 if value < 0:
                     raise InputValidationError(f"{key} cannot be negative, got {value}")
                 
             # Special validation for angles
-            if key in ['θ_source', 'θ_observer', 'θ1', 'θ2']:
+            if key in _ANGLES:
                 if not (-360 <= value <= 360):
                     raise InputValidationError(f"Angle {key} must be between -360 and 360 degrees, got {value}")
                 
             # Special validation for frequencies
-            if key in ['f', 'f_observed', 'f_source'] and value == 0:
+            if key in _FREQUENCIES and value == 0:
                 raise InputValidationError(f"Frequency {key} cannot be zero")
                 
             # Special validation for refractive indices
-            if key in ['n1', 'n2'] and value < 1:
+            if key in _REFRACTIVE_INDICES and value < 1:
                 raise InputValidationError(f"Refractive index {key} should typically be ≥1, got {value}")
                 
             # Special validation for velocities
-            if key in ['v_source', 'v_observer'] and abs(value) > 3 * self.speed_of_sound:
+            if key in _VELOCITIES and abs(value) > 3 * self.speed_of_sound:
                 raise PhysicsConfigurationError(f"Velocity {key} exceeds 3x speed of sound: {value} m/s")
 
-        # Category-specific validations
+    def _validate_relations(self, inputs: Dict[str, float], category: str) -> None:
+        """Category-specific checks between values"""
         if category == 'wave_properties':
             if inputs.get('λ') is not None and inputs.get('f') is not None:
                 if inputs['λ'] * inputs['f'] > 1.1 * self.speed_of_light:
@@ -81,26 +156,27 @@ class WaveSolver:
                 if inputs['θ1'] > critical_angle:
                     raise PhysicsConfigurationError(f"Angle θ1={inputs['θ1']}° exceeds critical angle {critical_angle:.1f}°")
 
+    def _sanity_check(self, category: str, solutions: Dict[str, float], given) -> None:
+        """Validate a solution; given values were already checked on the way in"""
+        # Derived values still need per-value checks (reverse Doppler can give v_source < 0)
+        self._validate_values({k: v for k, v in solutions.items() if k not in given})
+        self._validate_relations(solutions, category)
+
     def _check_sufficient_data(self, category: str) -> None:
         """Check if enough data is provided to solve the problem"""
+        s = self.state
         if category == 'wave_properties':
-            if not any(k in self.solutions and self.solutions[k] is not None 
-                      for k in ['v', 'f', 'λ']):
+            if s.v is None and s.f is None and s.λ is None:
                 raise InsufficientDataError("Need at least two of: v/f/λ")
                 
         elif category == 'sound_waves':
-            if not (('f_source' in self.solutions and self.solutions['f_source'] is not None) and
-                   (('v_source' in self.solutions and self.solutions['v_source'] is not None) or
-                    ('v_observer' in self.solutions and self.solutions['v_observer'] is not None))):
+            if s.f_source is None or (s.v_source is None and s.v_observer is None):
                 raise InsufficientDataError(
                     "Need source frequency and either source or observer velocity"
                 )
                 
         elif category == 'light_properties':
-            if not (('n1' in self.solutions and self.solutions['n1'] is not None) and
-                   ('n2' in self.solutions and self.solutions['n2'] is not None) and
-                   (('θ1' in self.solutions and self.solutions['θ1'] is not None) or
-                    ('θ2' in self.solutions and self.solutions['θ2'] is not None))):
+            if s.n1 is None or s.n2 is None or (s.θ1 is None and s.θ2 is None):
                 raise InsufficientDataError(
                     "Need both refractive indices and at least one angle"
                 )
@@ -108,54 +184,28 @@ class WaveSolver:
     def solve(self, category: str, **kwargs) -> Dict[str, float]:
         """Main solver with comprehensive error handling"""
         try:
-            # Initialize all possible variables with None
-            self.solutions = {
-                # Wave properties
-                'v': None, 'f': None, 'λ': None, 'T': None, 'k': None, 'ω': None,
-                # Sound waves
-                'f_observed': None, 'f_source': None, 'v_source': None, 'v_observer': None,
-                'v_medium': None, 'θ_source': None, 'θ_observer': None,
-                # Light properties
-                'n1': None, 'n2': None, 'θ1': None, 'θ2': None, 'I1': None, 'I2': None
-            }
-
             # Validate inputs before processing
             self._validate_inputs(kwargs, category)
-            
-            # Set provided values
-            for k, v in kwargs.items():
-                if k in self.solutions:
-                    self.solutions[k] = v
+
+            # Unknown keys are ignored; everything not provided starts as None
+            self.state = WaveState(**{k: v for k, v in kwargs.items() if k in _STATE_FIELDS})
 
             # Check if we have enough data to start solving
             self._check_sufficient_data(category)
 
-            # Keep solving until no more progress can be made
-            changed = True
-            iteration = 0
-            
-            while changed and iteration < self.max_iterations:
-                changed = False
-                iteration += 1
-
-                if category == 'wave_properties':
-                    changed = self._solve_wave_properties()
-                elif category == 'sound_waves':
-                    changed = self._solve_sound_waves()
-                elif category == 'light_properties':
-                    changed = self._solve_light_properties()
-
-            if iteration >= self.max_iterations:
-                raise WaveError("Maximum iterations reached without convergence")
+            # Derive every unknown reachable from the given values
+            if category in self.rules:
+                self._propagate(category)
 
             # Final validation of results
-            self._validate_inputs(
-                {k: v for k, v in self.solutions.items() if v is not None},
-                category
-            )
+            solutions = self.state.as_dict()
+            self._sanity_check(category, solutions, kwargs)
 
-            return {k: v for k, v in self.solutions.items() if v is not None}
+            return solutions
 
+        except WaveError:
+            # Already specific (validation, missing data, impossible setup); keep the type
+            raise
         except ZeroDivisionError as e:
             raise WaveError("Division by zero occurred in calculations") from e
         except ValueError as e:
@@ -163,204 +213,326 @@ class WaveSolver:
         except Exception as e:
             raise WaveError(f"Error solving {category} problem: {str(e)}") from e
 
-    def _solve_wave_properties(self) -> bool:
-        """Solve wave property equations with robust error handling"""
-        changed = False
-
-        try:
-            # v = λf
-            if self.solutions['v'] is None:
-                if self.solutions['λ'] is not None and self.solutions['f'] is not None:
-                    self.solutions['v'] = self.solutions['λ'] * self.solutions['f']
-                    changed = True
-        
-            if self.solutions['λ'] is None:
-                if self.solutions['v'] is not None and self.solutions['f'] is not None:
-                    if self.solutions['f'] == 0:
-                        raise PhysicsConfigurationError("Frequency cannot be zero when calculating wavelength")
-                    self.solutions['λ'] = self.solutions['v'] / self.solutions['f']
-                    changed = True
-        
-            if self.solutions['f'] is None:
-                if self.solutions['v'] is not None and self.solutions['λ'] is not None:
-                    if self.solutions['λ'] == 0:
-                        raise PhysicsConfigurationError("Wavelength cannot be zero when calculating frequency")
-                    self.solutions['f'] = self.solutions['v'] / self.solutions['λ']
-                    changed = True
-        
-            # T = 1/f
-            if self.solutions['T'] is None and self.solutions['f'] is not None:
-                if self.solutions['f'] == 0:
-                    raise PhysicsConfigurationError("Frequency cannot be zero when calculating period")
-                self.solutions['T'] = 1 / self.solutions['f']
-                changed = True
-        
-            if self.solutions['f'] is None and self.solutions['T'] is not None:
-                if self.solutions['T'] == 0:
-                    raise PhysicsConfigurationError("Period cannot be zero when calculating frequency")
-                self.solutions['f'] = 1 / self.solutions['T']
-                changed = True
-        
-            # ω = 2πf
-            if self.solutions['ω'] is None and self.solutions['f'] is not None:
-                self.solutions['ω'] = 2 * math.pi * self.solutions['f']
-                changed = True
-        
-            if self.solutions['f'] is None and self.solutions['ω'] is not None:
-                self.solutions['f'] = self.solutions['ω'] / (2 * math.pi)
-                changed = True
-        
-            # k = 2π/λ
-            if self.solutions['k'] is None and self.solutions['λ'] is not None:
-                if self.solutions['λ'] == 0:
-                    raise PhysicsConfigurationError("Wavelength cannot be zero when calculating wave number")
-                self.solutions['k'] = 2 * math.pi / self.solutions['λ']
-                changed = True
-        
-            if self.solutions['λ'] is None and self.solutions['k'] is not None:
-                if self.solutions['k'] == 0:
-                    raise PhysicsConfigurationError("Wave number cannot be zero when calculating wavelength")
-                self.solutions['λ'] = 2 * math.pi / self.solutions['k']
-                changed = True
-
-        except Exception as e:
-            raise WaveError(f"Wave properties calculation error: {str(e)}") from e
-
-        return changed
-
-    def _solve_sound_waves(self) -> bool:
-        """Solve sound wave equations including Doppler effect with robust validation"""
-        changed = False
-
-        try:
-            # Set default speed of sound if not provided
-            if self.solutions['v_medium'] is None:
-                self.solutions['v_medium'] = self.speed_of_sound
-                changed = True
-        
-            v_medium = self.solutions['v_medium']
-            f_source = self.solutions['f_source']
-            f_observed = self.solutions['f_observed']
-            v_source = self.solutions['v_source']
-            v_observer = self.solutions['v_observer']
-            θ_source = self.solutions['θ_source']
-            θ_observer = self.solutions['θ_observer']
-            
-            # 1. Calculate f_observed if possible
-            if f_observed is None and f_source is not None and v_medium is not None:
-                # Source moving directly toward observer
-                if v_source is not None and (θ_source is None or math.isclose(θ_source, 0, abs_tol=1e-6)):
-                    if math.isclose(v_source, v_medium, abs_tol=1e-6):
-                        raise PhysicsConfigurationError("Source velocity equals speed of sound (sonic boom)")
-                    self.solutions['f_observed'] = (v_medium / (v_medium - v_source)) * f_source
-                    changed = True
-                
-                # Observer moving directly toward source
-                elif v_observer is not None and (θ_observer is None or math.isclose(θ_observer, 0, abs_tol=1e-6)):
-                    self.solutions['f_observed'] = ((v_medium + v_observer) / v_medium) * f_source
-                    changed = True
-                
-                # General case with angles
-                elif v_source is not None and θ_source is not None:
-                    denominator = v_medium - v_source * math.cos(math.radians(θ_source))
-                    if abs(denominator) < 1e-6:
-                        raise PhysicsConfigurationError("Denominator approaches zero in Doppler calculation")
-                    self.solutions['f_observed'] = (v_medium / denominator) * f_source
-                    changed = True
-            
-            # 2. Calculate v_source if possible (reverse Doppler)
-            if v_source is None and f_observed is not None and f_source is not None and v_medium is not None:
-                if (θ_source is None or math.isclose(θ_source, 0, abs_tol=1e-6)):
-                    if f_observed == 0:
-                        raise PhysicsConfigurationError("Observed frequency cannot be zero")
-                    candidate_v_source = v_medium * (1 - f_source / f_observed)
-                    if abs(candidate_v_source) < 1.5 * v_medium:  # sanity check
-                        self.solutions['v_source'] = candidate_v_source
-                        changed = True
-            
-            # 3. Calculate v_observer if possible (reverse Doppler)
-            if v_observer is None and f_observed is not None and f_source is not None and v_medium is not None:
-                if (θ_observer is None or math.isclose(θ_observer, 0, abs_tol=1e-6)):
-                    if f_source == 0:
-                        raise PhysicsConfigurationError("Source frequency cannot be zero")
-                    candidate_v_observer = v_medium * (f_observed / f_source - 1)
-                    if abs(candidate_v_observer) < 1.5 * v_medium:  # sanity check
-                        self.solutions['v_observer'] = candidate_v_observer
-                        changed = True
-
-        except Exception as e:
-            raise WaveError(f"Sound wave calculation error: {str(e)}") from e
-
-        return changed
-
-    def _solve_light_properties(self) -> bool:
-        """Solve light wave equations including Snell's law and intensity with robust checks"""
-        changed = False
-
-        try:
-            # Snell's law: n1 sinθ1 = n2 sinθ2
-            if self.solutions['θ2'] is None:
-                if all(k in self.solutions and self.solutions[k] is not None 
-                     for k in ['n1', 'n2', 'θ1']):
-                    
-                    n1, n2, θ1 = self.solutions['n1'], self.solutions['n2'], self.solutions['θ1']
-                    sinθ2 = (n1 * math.sin(math.radians(θ1))) / n2
-                    
-                    if abs(sinθ2) > 1:
-                        raise PhysicsConfigurationError("Total internal reflection occurs (sinθ2 > 1)")
-                    self.solutions['θ2'] = math.degrees(math.asin(sinθ2))
-                    changed = True
-            
-            if self.solutions['θ1'] is None:
-                if all(k in self.solutions and self.solutions[k] is not None 
-                     for k in ['n1', 'n2', 'θ2']):
-                    
-                    n1, n2, θ2 = self.solutions['n1'], self.solutions['n2'], self.solutions['θ2']
-                    sinθ1 = (n2 * math.sin(math.radians(θ2))) / n1
-                    
-                    if abs(sinθ1) > 1:
-                        raise PhysicsConfigurationError("Invalid configuration (sinθ1 > 1)")
-                    self.solutions['θ1'] = math.degrees(math.asin(sinθ1))
-                    changed = True
-            
-            # Intensity ratio: I1/I2 = (n1/n2) for transmitted light
-            if self.solutions['I2'] is None:
-                if all(k in self.solutions and self.solutions[k] is not None 
-                     for k in ['I1', 'n1', 'n2']):
-                    
-                    if self.solutions['n2'] == 0:
-                        raise PhysicsConfigurationError("Refractive index n2 cannot be zero")
-                    self.solutions['I2'] = self.solutions['I1'] * (self.solutions['n2'] / self.solutions['n1'])
-                    changed = True
-            
-            if self.solutions['I1'] is None:
-                if all(k in self.solutions and self.solutions[k] is not None 
-                     for k in ['I2', 'n1', 'n2']):
-                    
-                    if self.solutions['n1'] == 0:
-                        raise PhysicsConfigurationError("Refractive index n1 cannot be zero")
-                    self.solutions['I1'] = self.solutions['I2'] * (self.solutions['n1'] / self.solutions['n2'])
-                    changed = True
-
-        except Exception as e:
-            raise WaveError(f"Light properties calculation error: {str(e)}") from e
+    def _propagate(self, category: str) -> None:
+        """Run the category's equations once, in dependency order"""
+        state = self.state
+        known = {name for name in self._rule_vars[category] if getattr(state, name) is not None}
+        mark_known = known.add
 
-        return changed
+        for inputs, output, equation in self._plan(category, frozenset(known)):
+            # An earlier equation that didn't apply can leave this one short of inputs
+            if not inputs <= known:
+                continue
+            value = equation(state)
+            if value is None:
+                continue
+            setattr(state, output, value)
+            mark_known(output)
+
+    def _plan(self, category: str, known: frozenset) -> Tuple[tuple, ...]:
+        """Topologically ordered equations for a given set of known quantities.
+        The order depends only on which values are known, so it is worked out
+        once per combination and reused."""
+        plan = self._plans.get((category, known))
+        if plan is None:
+            plan = self._plans[(category, known)] = self._build_plan(category, known)
+        return plan
+
+    def _build_plan(self, category: str, known: frozenset) -> Tuple[tuple, ...]:
+        """Walk the dependency graph as if every equation applies: start from the
+        equations whose inputs are given and wake dependants as outputs appear"""
+        by_input = self._rules_by_input[category]
+        known = set(known)
+        queue = deque(rule for rule in self.rules[category] if rule[0] <= known)
+        plan = []
+
+        while queue:
+            rule = queue.popleft()
+            output = rule[1]
+            if output in known:
+                continue
+            plan.append(rule)
+            known.add(output)
+            for dependant in by_input.get(output, ()):
+                if dependant[1] not in known and dependant[0] <= known:
+                    queue.append(dependant)
+
+        return tuple(plan)
+
+    def _build_rules(self) -> Dict[str, list]:
+        """Encode each equation as (inputs, output, equation), in the order they should be tried"""
+        return {
+            'wave_properties': [
+                # v = λf
+                (frozenset(('λ', 'f')), 'v', lambda s: s.λ * s.f),
+                (frozenset(('v', 'f')), 'λ', lambda s: _divide(
+                    s.v, s.f, "Frequency cannot be zero when calculating wavelength")),
+                (frozenset(('v', 'λ')), 'f', lambda s: _divide(
+                    s.v, s.λ, "Wavelength cannot be zero when calculating frequency")),
+                # T = 1/f
+                (frozenset(('f',)), 'T', lambda s: _divide(
+                    1, s.f, "Frequency cannot be zero when calculating period")),
+                (frozenset(('T',)), 'f', lambda s: _divide(
+                    1, s.T, "Period cannot be zero when calculating frequency")),
+                # ω = 2πf
+                (frozenset(('f',)), 'ω', lambda s: _TAU * s.f),
+                (frozenset(('ω',)), 'f', lambda s: s.ω / _TAU),
+                # k = 2π/λ
+                (frozenset(('λ',)), 'k', lambda s: _divide(
+                    _TAU, s.λ, "Wavelength cannot be zero when calculating wave number")),
+                (frozenset(('k',)), 'λ', lambda s: _divide(
+                    _TAU, s.k, "Wave number cannot be zero when calculating wavelength")),
+            ],
+            'sound_waves': [
+                # Default speed of sound if not provided
+                (frozenset(), 'v_medium', lambda s: self.speed_of_sound),
+                (frozenset(('f_source', 'v_medium')), 'f_observed', self._doppler_observed),
+                (frozenset(('f_observed', 'f_source', 'v_medium')), 'v_source', self._doppler_source_velocity),
+                (frozenset(('f_observed', 'f_source', 'v_medium')), 'v_observer', self._doppler_observer_velocity),
+            ],
+            'light_properties': [
+                # Snell's law: n1 sinθ1 = n2 sinθ2
+                (frozenset(('n1', 'n2', 'θ1')), 'θ2', self._snell_refracted_angle),
+                (frozenset(('n1', 'n2', 'θ2')), 'θ1', self._snell_incident_angle),
+                # Intensity ratio: I1/I2 = (n1/n2) for transmitted light
+                (frozenset(('I1', 'n1', 'n2')), 'I2', lambda s: s.I1 * _divide(
+                    s.n2, s.n1, "Refractive index n1 cannot be zero")),
+                (frozenset(('I2', 'n1', 'n2')), 'I1', lambda s: s.I2 * _divide(
+                    s.n1, s.n2, "Refractive index n2 cannot be zero")),
+            ],
+        }
+
+    def _doppler_observed(self, s: WaveState) -> Optional[float]:
+        """Observed frequency from a moving source or observer"""
+        v_medium, f_source = s.v_medium, s.f_source
+        v_source, v_observer = s.v_source, s.v_observer
+        θ_source, θ_observer = s.θ_source, s.θ_observer
+
+        # Source moving directly toward observer
+        if v_source is not None and (θ_source is None or abs(θ_source) < _EPS):
+            if abs(v_source - v_medium) < _EPS:
+                raise PhysicsConfigurationError("Source velocity equals speed of sound (sonic boom)")
+            return (v_medium / (v_medium - v_source)) * f_source
+
+        # Observer moving directly toward source
+        if v_observer is not None and (θ_observer is None or abs(θ_observer) < _EPS):
+            return ((v_medium + v_observer) / v_medium) * f_source
+
+        # General case with angles
+        if v_source is not None and θ_source is not None:
+            denominator = v_medium - v_source * math.cos(math.radians(θ_source))
+            if abs(denominator) < _EPS:
+                raise PhysicsConfigurationError("Denominator approaches zero in Doppler calculation")
+            return (v_medium / denominator) * f_source
+
+        return None
+
+    def _doppler_source_velocity(self, s: WaveState) -> Optional[float]:
+        """Reverse Doppler for a source moving directly toward the observer"""
+        θ_source = s.θ_source
+        if θ_source is not None and abs(θ_source) >= _EPS:
+            return None
+        if s.f_observed == 0:
+            raise PhysicsConfigurationError("Observed frequency cannot be zero")
+        candidate_v_source = s.v_medium * (1 - s.f_source / s.f_observed)
+        if abs(candidate_v_source) < 1.5 * s.v_medium:  # sanity check
+            return candidate_v_source
+        return None
+
+    def _doppler_observer_velocity(self, s: WaveState) -> Optional[float]:
+        """Reverse Doppler for an observer moving directly toward the source"""
+        θ_observer = s.θ_observer
+        if θ_observer is not None and abs(θ_observer) >= _EPS:
+            return None
+        if s.f_source == 0:
+            raise PhysicsConfigurationError("Source frequency cannot be zero")
+        candidate_v_observer = s.v_medium * (s.f_observed / s.f_source - 1)
+        if abs(candidate_v_observer) < 1.5 * s.v_medium:  # sanity check
+            return candidate_v_observer
+        return None
+
+    def _snell_refracted_angle(self, s: WaveState) -> float:
+        """θ2 from n1 sinθ1 = n2 sinθ2"""
+        sinθ2 = (s.n1 * math.sin(math.radians(s.θ1))) / s.n2
+        if abs(sinθ2) > 1:
+            raise PhysicsConfigurationError("Total internal reflection occurs (sinθ2 > 1)")
+        return math.degrees(math.asin(sinθ2))
+
+    def _snell_incident_angle(self, s: WaveState) -> float:
+        """θ1 from n1 sinθ1 = n2 sinθ2"""
+        sinθ1 = (s.n2 * math.sin(math.radians(s.θ2))) / s.n1
+        if abs(sinθ1) > 1:
+            raise PhysicsConfigurationError("Invalid configuration (sinθ1 > 1)")
+        return math.degrees(math.asin(sinθ1))
+
+
+# One solver per thread for the convenience functions; solve() keeps its
+# working state on the instance, so threads must not share one
+_LOCAL = threading.local()
+
+
+def _get_solver() -> WaveSolver:
+    solver = getattr(_LOCAL, 'solver', None)
+    if solver is None:
+        solver = _LOCAL.solver = WaveSolver()
+    return solver
+
+
+@functools.lru_cache(maxsize=256)
+def _solve_cached(category: str, inputs: Tuple[Tuple[str, type, float], ...]) -> Dict[str, float]:
+    """Solve once per distinct set of inputs; the solver is pure w.r.t. its inputs"""
+    return _get_solver().solve(category, **{name: value for name, _, value in inputs})
+
+
+def solve(category: str, **kwargs) -> Dict[str, float]:
+    """Solve a category on this thread's solver, reusing results for repeated inputs"""
+    # Keep argument order in the key so validation reports errors in the same order.
+    # The type is part of the key because 1, 1.0 and True hash and compare equal.
+    key = tuple((name, type(value), value) for name, value in kwargs.items())
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable values can't be cached; let validation report them
+        return _get_solver().solve(category, **kwargs)
+    # Copy so callers can't mutate the cached result
+    return dict(_solve_cached(category, key))
 
 
 def solve_wave_properties(**kwargs) -> Dict[str, float]:
     """Convenience function for wave properties with error handling"""
-    solver = WaveSolver()
-    return solver.solve('wave_properties', **kwargs)
+    return solve('wave_properties', **kwargs)
 
 
 def solve_sound_waves(**kwargs) -> Dict[str, float]:
     """Convenience function for sound waves with error handling"""
-    solver = WaveSolver()
-    return solver.solve('sound_waves', **kwargs)
+    return solve('sound_waves', **kwargs)
 
 
 def solve_light_properties(**kwargs) -> Dict[str, float]:
     """Convenience function for light properties with error handling"""
-    solver = WaveSolver()
-    return solver.solve('light_properties', **kwargs)
+    return solve('light_properties', **kwargs)
+
+
+def solve_snell_batch(n1, n2, θ1) -> np.ndarray:
+    """Refraction angle θ2 (degrees) for arrays of n1, n2 and θ1.
+    Entries that would totally internally reflect come back as NaN."""
+    n1, n2, θ1 = (np.asarray(a, dtype=float) for a in (n1, n2, θ1))
+    sinθ2 = n1 * np.sin(np.deg2rad(θ1)) / n2
+    with np.errstate(invalid='ignore'):
+        return np.rad2deg(np.arcsin(sinθ2))
+
+
+def solve_doppler_batch(f_source, v_source, θ_source=0.0, v_medium=343.0) -> np.ndarray:
+    """Observed frequency for arrays of moving sources (angles in degrees).
+    Entries at or near the sonic-boom singularity come back as NaN."""
+    f_source, v_source, θ_source, v_medium = (
+        np.asarray(a, dtype=float) for a in (f_source, v_source, θ_source, v_medium))
+    denominator = v_medium - v_source * np.cos(np.deg2rad(θ_source))
+    denominator = np.where(np.abs(denominator) < _EPS, np.nan, denominator)
+    return v_medium * f_source / denominator
+
+
+_WAVE_KEYS = ('v', 'f', 'λ', 'T', 'k', 'ω')
+
+
+def _fill_unknown(out: Dict[str, np.ndarray], key: str, candidate: np.ndarray) -> None:
+    """Write candidate into the NaN (unknown) slots of out[key], skipping non-finite results"""
+    np.copyto(out[key], candidate, where=np.isnan(out[key]) & np.isfinite(candidate))
+
+
+def solve_wave_properties_batch(**arrays) -> Dict[str, np.ndarray]:
+    """Vectorised wave_properties: each keyword is an array (or scalar) of values,
+    with NaN or None marking unknowns. Returns one float array per quantity;
+    entries that can't be derived (or would divide by zero) stay NaN.
+    Inputs are not range-checked like the scalar solver."""
+    given = {k: np.asarray(arrays[k], dtype=float) for k in _WAVE_KEYS if arrays.get(k) is not None}
+    shape = np.broadcast_shapes(*(a.shape for a in given.values())) if given else ()
+    out = {k: np.array(np.broadcast_to(given[k], shape)) if k in given else np.full(shape, np.nan)
+           for k in _WAVE_KEYS}
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        unknown = sum(int(np.isnan(a).sum()) for a in out.values())
+        # Each sweep fills at least one slot per row or nothing at all
+        for _ in range(len(_WAVE_KEYS)):
+            _fill_unknown(out, 'v', out['λ'] * out['f'])
+            _fill_unknown(out, 'λ', out['v'] / out['f'])
+            _fill_unknown(out, 'f', out['v'] / out['λ'])
+            _fill_unknown(out, 'T', 1 / out['f'])
+            _fill_unknown(out, 'f', 1 / out['T'])
+            _fill_unknown(out, 'ω', _TAU * out['f'])
+            _fill_unknown(out, 'f', out['ω'] / _TAU)
+            _fill_unknown(out, 'k', _TAU / out['λ'])
+            _fill_unknown(out, 'λ', _TAU / out['k'])
+
+            remaining = sum(int(np.isnan(a).sum()) for a in out.values())
+            if remaining == unknown:
+                break
+            unknown = remaining
+
+    return out
+
+
+def _as_batch(value) -> np.ndarray:
+    """Float array for a batch argument, with None meaning unknown (NaN)"""
+    return np.asarray(np.nan if value is None else value, dtype=float)
+
+
+def solve_light_properties_batch(n1, n2, θ1=None, θ2=None, I1=None, I2=None
+                                 ) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """Vectorised light_properties. Returns the solved arrays plus a boolean
+    mask of rows that are physically impossible (no refracted ray, or a zero
+    refractive index) instead of raising per element; those rows have NaN for
+    the values they were asked to solve."""
+    n1, n2, θ1, θ2, I1, I2 = np.broadcast_arrays(*map(_as_batch, (n1, n2, θ1, θ2, I1, I2)))
+
+    # A zero index would divide by zero below; solve with it unknown instead
+    zero_index = (n1 == 0) | (n2 == 0)
+    m1 = np.where(zero_index, np.nan, n1)
+    m2 = np.where(zero_index, np.nan, n2)
+    impossible = zero_index.copy()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Snell's law both ways; solve_snell_batch marks total internal reflection as NaN
+        θ2_missing = np.isnan(θ2)
+        θ2_calc = solve_snell_batch(m1, m2, θ1)
+        impossible |= θ2_missing & ~np.isnan(θ1) & np.isnan(θ2_calc)
+        θ2 = np.where(θ2_missing, θ2_calc, θ2)
+
+        θ1_missing = np.isnan(θ1)
+        θ1_calc = solve_snell_batch(m2, m1, θ2)
+        impossible |= θ1_missing & ~np.isnan(θ2) & np.isnan(θ1_calc)
+        θ1 = np.where(θ1_missing, θ1_calc, θ1)
+
+        # Intensity ratio: I1/I2 = (n1/n2) for transmitted light
+        I2 = np.where(np.isnan(I2), I1 * (m2 / m1), I2)
+        I1 = np.where(np.isnan(I1), I2 * (m1 / m2), I1)
+
+    return {'n1': n1, 'n2': n2, 'θ1': θ1, 'θ2': θ2, 'I1': I1, 'I2': I2}, impossible
+
+
+def solve_sound_waves_batch(f_source, v_source=None, v_observer=None, θ_source=None,
+                            θ_observer=None, v_medium=343.0
+                            ) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """Vectorised observed frequency, picking the same Doppler case per row as
+    WaveSolver (moving source, then moving observer, then angled source).
+    Returns the arrays plus a mask of sonic-boom rows, which get NaN."""
+    f_source, v_source, v_observer, θ_source, θ_observer, v_medium = np.broadcast_arrays(
+        *map(_as_batch, (f_source, v_source, v_observer, θ_source, θ_observer, v_medium)))
+
+    has_source = ~np.isnan(v_source)
+    source_head_on = has_source & (np.isnan(θ_source) | (np.abs(θ_source) < _EPS))
+    observer_head_on = (~source_head_on & ~np.isnan(v_observer)
+                        & (np.isnan(θ_observer) | (np.abs(θ_observer) < _EPS)))
+    source_angled = has_source & ~source_head_on & ~observer_head_on
+    use_source = source_head_on | source_angled
+
+    with np.errstate(invalid='ignore'):
+        # A head-on source is the θ = 0 case of the angled formula
+        f_from_source = solve_doppler_batch(f_source, v_source, np.nan_to_num(θ_source), v_medium)
+        f_from_observer = (v_medium + v_observer) / v_medium * f_source
+    f_observed = np.where(use_source, f_from_source,
+                          np.where(observer_head_on, f_from_observer, np.nan))
+    impossible = use_source & np.isnan(f_from_source)
+
+    return {'f_source': f_source, 'f_observed': f_observed, 'v_source': v_source,
+            'v_observer': v_observer, 'v_medium': v_medium}, impossible
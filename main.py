@@ -2,17 +2,30 @@ import sys
 import logging
 import traceback
 from PyQt6.QtWidgets import QApplication
-from ui.main_window import PhysicsCalculator
 from core.auth import AuthManager
 from ui.login_dialog import LoginDialog
 from PyQt6.QtWidgets import QDialog
+from PyQt6.QtCore import QTimer
 from dotenv import load_dotenv
+import socket
 import subprocess
 
 
 load_dotenv()
 
-subprocess.Popen([sys.executable, "verify_server.py"])
+VERIFY_SERVER_PORT = 5000  # Flask default, matches the link sent by AuthManager
+
+
+def _ensure_verify_server():
+    """Start verify_server.py unless one is already listening"""
+    try:
+        with socket.create_connection(('127.0.0.1', VERIFY_SERVER_PORT), timeout=0.1):
+            logging.info("Verify server already running")
+            return
+    except OSError:
+        pass
+    logging.info("Starting verify server")
+    subprocess.Popen([sys.executable, "verify_server.py"])
 
 
 logging.basicConfig(
@@ -38,6 +51,9 @@ def main():
         
         logging.info("Creating QApplication")
         app = QApplication(sys.argv)
+
+        # Runs once the first event loop starts, so the login dialog paints first
+        QTimer.singleShot(0, _ensure_verify_server)
         
         logging.info("Creating AuthManager")
         auth = AuthManager()
@@ -59,6 +75,8 @@ def main():
             
             if user:  # Only proceed if login succeeded
                 logging.info(f"User {user['username']} logged in (ID: {user['id']})")
+                # Imported here so the login dialog doesn't wait on every tab module
+                from ui.main_window import PhysicsCalculator
                 calculator = PhysicsCalculator(auth)
                 calculator.show()
                 sys.exit(app.exec())
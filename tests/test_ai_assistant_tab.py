@@ -0,0 +1,89 @@
+import os
+import threading
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+import ui.ai_assistant_tab as ai_tab
+
+
+@pytest.fixture(scope="module")
+def app():
+    # One application for the whole module, as in a real run
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def tab(app, monkeypatch):
+    # Don't start loading the model in the background
+    monkeypatch.setattr(ai_tab, "ENABLE_AI", False)
+    tab = ai_tab.AIAssistantTab()
+    yield tab
+    tab.close()
+    app.processEvents()
+
+
+@pytest.mark.parametrize("response", [
+    "Request failed: space is offline",
+    "The answer is 9.8 m/s^2",
+])
+def test_bad_responses_are_not_cached(tab, response):
+    tab.handle_response(response, key="what is g?")
+    assert "what is g?" not in tab._answer_cache
+    assert tab.submit_btn.isEnabled()
+
+
+def test_malformed_response_is_flagged(tab):
+    tab.handle_response("The answer is 9.8 m/s^2", key="what is g?")
+    assert tab.response_display.toPlainText().startswith("ERROR: AI failed to follow the required format")
+
+
+def test_valid_response_is_cached(tab):
+    response = "**Final Answer:** 9.8 m/s^2"
+    tab.handle_response(response, key="what is g?")
+    assert tab._answer_cache["what is g?"] == response
+    assert tab.response_display.toPlainText() == response
+
+
+class _BlockingModel:
+    """Stands in for PhysicsMistral; holds each request until released"""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def analyze_question(self, question):
+        self.release.wait(5)
+        return "**Final Answer:** late"
+
+
+def test_shutdown_detaches_in_flight_question(app, tab, monkeypatch):
+    monkeypatch.setattr(ai_tab, "_AI_EXIT_WAIT_MS", 50)
+    tab.mistral = _BlockingModel()
+    tab.process_question("what is g?")
+    tab.shutdown()
+    assert tab.worker is None
+
+    # The request finishes after shutdown; its answer must not reach the tab
+    tab.mistral.release.set()
+    assert ai_tab._AI_POOL.waitForDone(5000)
+    app.processEvents()
+    assert tab.response_display.toPlainText() == "Processing..."
+    assert "what is g?" not in tab._answer_cache
+
+
+def test_failed_preload_is_logged_not_shown(tab, caplog):
+    tab.response_display.setPlainText("")
+    tab.on_model_error("space is offline")
+    assert "Error loading AI model: space is offline" in caplog.text
+    assert tab.response_display.toPlainText() == ""
+
+
+def test_failed_load_is_shown_to_waiting_question(tab):
+    tab._set_busy(True)
+    tab._pending_question = "what is g?"
+    tab.on_model_error("space is offline")
+    assert tab.response_display.toPlainText() == "Error loading AI model: space is offline"
+    assert tab._pending_question is None
+    assert tab.submit_btn.isEnabled()
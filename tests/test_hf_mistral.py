@@ -0,0 +1,66 @@
+import pytest
+
+pytest.importorskip("gradio_client")
+
+from core.physics_ai.hf_mistral import PhysicsMistral
+
+
+class _Job:
+    def __init__(self, client, answer):
+        self.client = client
+        self.answer = answer
+
+    def result(self):
+        self.client.events.append("result")
+        if isinstance(self.answer, Exception):
+            raise self.answer
+        return self.answer
+
+
+class _StubClient:
+    """Answers each question with its own text; some questions fail on purpose"""
+
+    def __init__(self):
+        self.submitted = []
+        self.events = []
+
+    def submit(self, prompt, api_name):
+        assert api_name == "/predict"
+        self.submitted.append(prompt)
+        self.events.append("submit")
+        if "offline" in prompt:
+            raise ConnectionError("space is offline")
+        if "timeout" in prompt:
+            return _Job(self, TimeoutError("no answer"))
+        return _Job(self, f"answer to {prompt}")
+
+
+def _model():
+    # Skip __init__ so no connection to the Space is made
+    model = PhysicsMistral.__new__(PhysicsMistral)
+    model.client = _StubClient()
+    return model
+
+
+def test_analyze_questions_keeps_order():
+    model = _model()
+    answers = model.analyze_questions(["a", "b", "c"])
+    assert answers == ["answer to Question: a", "answer to Question: b", "answer to Question: c"]
+    # Every job is submitted before any result is collected
+    assert model.client.submitted == ["Question: a", "Question: b", "Question: c"]
+    assert model.client.events == ["submit"] * 3 + ["result"] * 3
+
+
+def test_analyze_questions_reports_failures_in_place():
+    model = _model()
+    answers = model.analyze_questions(["a", "offline", "timeout", "d"])
+    assert answers == [
+        "answer to Question: a",
+        "Request failed: space is offline",
+        "Request failed: no answer",
+        "answer to Question: d",
+    ]
+
+
+def test_analyze_questions_empty():
+    assert _model().analyze_questions([]) == []
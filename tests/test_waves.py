@@ -0,0 +1,321 @@
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from core.waves import (
+    InputValidationError,
+    InsufficientDataError,
+    PhysicsConfigurationError,
+    solve_doppler_batch,
+    solve_light_properties,
+    solve_light_properties_batch,
+    solve_snell_batch,
+    solve_sound_waves,
+    solve_sound_waves_batch,
+    solve_wave_properties,
+    solve_wave_properties_batch,
+)
+
+# A 5 Hz wave with a 2 m wavelength, as every quantity the solver knows about
+WAVE = {'v': 10.0, 'f': 5.0, 'λ': 2.0, 'T': 0.2, 'k': math.pi, 'ω': 10 * math.pi}
+_TIME_SIDE = {'f', 'T', 'ω'}
+_LENGTH_SIDE = {'λ', 'k'}
+
+
+def _expected_keys(given):
+    """Quantities the wave equations can reach from the given ones"""
+    known = set(given)
+    if known & _TIME_SIDE:
+        known |= _TIME_SIDE
+    if known & _LENGTH_SIDE:
+        known |= _LENGTH_SIDE
+    # v = λf ties the three together once any two are known
+    if ('v' in known) + bool(known & _TIME_SIDE) + bool(known & _LENGTH_SIDE) >= 2:
+        known |= set(WAVE)
+    return known
+
+
+@pytest.mark.parametrize("pair", list(itertools.combinations(WAVE, 2)), ids='-'.join)
+def test_wave_properties_pairs(pair):
+    given = {name: WAVE[name] for name in pair}
+    if not given.keys() & {'v', 'f', 'λ'}:
+        with pytest.raises(InsufficientDataError):
+            solve_wave_properties(**given)
+        return
+
+    result = solve_wave_properties(**given)
+    assert result.keys() == _expected_keys(given)
+    for name, value in result.items():
+        assert value == pytest.approx(WAVE[name]), name
+
+
+def test_wave_properties_zero_frequency():
+    with pytest.raises(InputValidationError):
+        solve_wave_properties(v=10, f=0)
+
+
+def test_wave_properties_zero_wavelength():
+    with pytest.raises(PhysicsConfigurationError):
+        solve_wave_properties(v=10, λ=0)
+
+
+def test_wave_properties_needs_data():
+    with pytest.raises(InsufficientDataError):
+        solve_wave_properties(T=0.2)
+
+
+def test_wave_properties_cache_keeps_input_types():
+    # Equal values of different types must not share a cached result
+    assert type(solve_wave_properties(v=1.0, f=2)['v']) is float
+    assert solve_wave_properties(v=True, f=2)['v'] is True
+    assert type(solve_wave_properties(v=1, f=2)['v']) is int
+
+
+@pytest.mark.parametrize("func", [solve_wave_properties, solve_sound_waves, solve_light_properties])
+def test_convenience_functions_are_named(func):
+    # Plain functions keep their own name and docstring for help() and tracebacks
+    assert func.__name__.startswith("solve_")
+    assert func.__doc__.startswith("Convenience function for")
+
+
+def test_sound_moving_source():
+    result = solve_sound_waves(f_source=500, v_source=30)
+    assert result['v_medium'] == 343
+    assert result['f_observed'] == pytest.approx(343 / (343 - 30) * 500)
+
+
+def test_sound_moving_observer():
+    result = solve_sound_waves(f_source=500, v_observer=30)
+    assert result['f_observed'] == pytest.approx((343 + 30) / 343 * 500)
+
+
+def test_sound_angled_source():
+    result = solve_sound_waves(f_source=500, v_source=30, θ_source=60)
+    assert result['f_observed'] == pytest.approx(343 / (343 - 30 * 0.5) * 500)
+
+
+def test_sound_source_velocity_from_observed():
+    f_observed = 343 / (343 - 30) * 500
+    result = solve_sound_waves(f_source=500, f_observed=f_observed, v_observer=0)
+    assert result['v_source'] == pytest.approx(30)
+
+
+def test_sound_observer_velocity_from_observed():
+    f_observed = (343 + 30) / 343 * 500
+    result = solve_sound_waves(f_source=500, f_observed=f_observed, v_source=0)
+    assert result['v_observer'] == pytest.approx(30)
+
+
+def test_sound_custom_medium():
+    result = solve_sound_waves(f_source=500, v_source=100, v_medium=1500)
+    assert result['f_observed'] == pytest.approx(1500 / 1400 * 500)
+
+
+def test_sound_sonic_boom():
+    with pytest.raises(PhysicsConfigurationError):
+        solve_sound_waves(f_source=500, v_source=343)
+
+
+def test_sound_zero_frequency():
+    with pytest.raises(InputValidationError):
+        solve_sound_waves(f_source=0, v_source=30)
+
+
+def test_sound_needs_velocity():
+    with pytest.raises(InsufficientDataError):
+        solve_sound_waves(f_source=500)
+
+
+def test_light_refracted_angle():
+    result = solve_light_properties(n1=1.0, n2=1.5, θ1=30)
+    assert result['θ2'] == pytest.approx(math.degrees(math.asin(math.sin(math.radians(30)) / 1.5)))
+
+
+def test_light_incident_angle():
+    θ2 = math.degrees(math.asin(math.sin(math.radians(30)) / 1.5))
+    result = solve_light_properties(n1=1.0, n2=1.5, θ2=θ2)
+    assert result['θ1'] == pytest.approx(30)
+
+
+def test_light_intensities():
+    assert solve_light_properties(n1=1.0, n2=1.5, θ1=30, I1=2)['I2'] == pytest.approx(3)
+    assert solve_light_properties(n1=1.0, n2=1.5, θ1=30, I2=3)['I1'] == pytest.approx(2)
+
+
+def test_light_total_internal_reflection():
+    with pytest.raises(PhysicsConfigurationError):
+        solve_light_properties(n1=1.5, n2=1.0, θ1=60)
+
+
+def test_light_no_incident_ray():
+    with pytest.raises(PhysicsConfigurationError):
+        solve_light_properties(n1=1.0, n2=1.5, θ2=60)
+
+
+def test_light_index_below_one():
+    with pytest.raises(InputValidationError):
+        solve_light_properties(n1=0.5, n2=1.5, θ1=30)
+
+
+def test_light_needs_angle():
+    with pytest.raises(InsufficientDataError):
+        solve_light_properties(n1=1.0, n2=1.5)
+
+
+def test_snell_batch_matches_scalar():
+    n1 = np.array([1.0, 1.0, 1.5, 1.5, 1.33])
+    n2 = np.array([1.5, 1.33, 1.0, 1.0, 1.0])
+    θ1 = np.array([30.0, 0.0, 30.0, 60.0, 80.0])
+    θ2 = solve_snell_batch(n1, n2, θ1)
+
+    for i in range(len(θ1)):
+        try:
+            expected = solve_light_properties(n1=n1[i], n2=n2[i], θ1=θ1[i])['θ2']
+        except PhysicsConfigurationError:
+            # Total internal reflection raises in the scalar solver, NaN here
+            assert np.isnan(θ2[i]), i
+        else:
+            assert θ2[i] == pytest.approx(expected), i
+    assert np.isnan(θ2).sum() == 2
+
+
+def test_doppler_batch_matches_scalar():
+    f_source = np.array([500.0, 500.0, 440.0, 500.0, 500.0])
+    v_source = np.array([30.0, 343.0, 100.0, 0.0, 686.0])
+    θ_source = np.array([0.0, 0.0, 60.0, 0.0, 60.0])
+    f_observed = solve_doppler_batch(f_source, v_source, θ_source)
+
+    for i in range(len(f_source)):
+        try:
+            expected = solve_sound_waves(f_source=f_source[i], v_source=v_source[i],
+                                         θ_source=θ_source[i])['f_observed']
+        except PhysicsConfigurationError:
+            # Sonic boom (head-on or along the angled component) is NaN here
+            assert np.isnan(f_observed[i]), i
+        else:
+            assert f_observed[i] == pytest.approx(expected), i
+    assert np.isnan(f_observed).sum() == 2
+
+
+def test_wave_properties_batch_matches_scalar():
+    # One row per input pair, plus a zero wavelength that the scalar solver rejects
+    rows = [{name: WAVE[name] for name in pair} for pair in itertools.combinations(WAVE, 2)]
+    rows.append({'v': 10.0, 'λ': 0.0})
+    result = solve_wave_properties_batch(
+        **{name: [row.get(name, np.nan) for row in rows] for name in WAVE})
+
+    for i, row in enumerate(rows):
+        try:
+            expected = solve_wave_properties(**row)
+        except InsufficientDataError:
+            # The batch solver doesn't insist on one of v/f/λ; it derives what it can
+            expected = {name: WAVE[name] for name in _expected_keys(row)}
+        except PhysicsConfigurationError:
+            # Divisions by zero leave every unknown in the row as NaN
+            expected = row
+        for name in WAVE:
+            if name in expected:
+                assert result[name][i] == pytest.approx(expected[name]), (i, name)
+            else:
+                assert np.isnan(result[name][i]), (i, name)
+
+
+def _batch_columns(rows, names):
+    """Column arrays for the batch solvers, NaN where a row leaves a value out"""
+    return {name: np.array([row.get(name, np.nan) for row in rows]) for name in names}
+
+
+def test_light_properties_batch_matches_scalar():
+    rows = [
+        {'n1': 1.0, 'n2': 1.5, 'θ1': 30.0, 'I1': 2.0},
+        {'n1': 1.0, 'n2': 1.5, 'θ2': 19.47, 'I2': 3.0},
+        {'n1': 1.5, 'n2': 1.0, 'θ1': 30.0},
+        # Total internal reflection, from either side
+        {'n1': 1.5, 'n2': 1.0, 'θ1': 60.0, 'I1': 2.0},
+        {'n1': 1.0, 'n2': 1.5, 'θ2': 60.0},
+    ]
+    names = ('n1', 'n2', 'θ1', 'θ2', 'I1', 'I2')
+    result, impossible = solve_light_properties_batch(**_batch_columns(rows, names))
+    assert impossible.tolist() == [False, False, False, True, True]
+
+    for i, row in enumerate(rows):
+        try:
+            expected = solve_light_properties(**row)
+        except PhysicsConfigurationError:
+            assert impossible[i], i
+            missing = 'θ2' if 'θ1' in row else 'θ1'
+            assert np.isnan(result[missing][i]), i
+            continue
+        assert not impossible[i], i
+        for name in names:
+            if name in expected:
+                assert result[name][i] == pytest.approx(expected[name]), (i, name)
+            else:
+                assert np.isnan(result[name][i]), (i, name)
+
+
+@pytest.mark.filterwarnings("error")
+def test_light_properties_batch_zero_index():
+    # Rows with a zero index are flagged without NumPy divide-by-zero warnings
+    result, impossible = solve_light_properties_batch(
+        n1=[0.0, 1.0, 1.0], n2=[1.5, 0.0, 1.5], θ1=30.0, I1=[2.0, 2.0, np.nan], I2=[np.nan, np.nan, 3.0])
+    assert impossible.tolist() == [True, True, False]
+    for name in ('θ2', 'I2'):
+        assert np.isnan(result[name][:2]).all(), name
+    # Given values come back untouched
+    assert result['n1'].tolist() == [0.0, 1.0, 1.0]
+    assert result['I1'][:2].tolist() == [2.0, 2.0]
+    assert result['I1'][2] == pytest.approx(2.0)
+    for n1, n2 in ((0.0, 1.5), (1.0, 0.0)):
+        # The scalar solver rejects the same rows outright
+        with pytest.raises(InputValidationError):
+            solve_light_properties(n1=n1, n2=n2, θ1=30.0, I1=2.0)
+
+
+def test_light_properties_batch_scalar_arguments():
+    result, impossible = solve_light_properties_batch(1.0, 1.5, θ1=30)
+    expected = solve_light_properties(n1=1.0, n2=1.5, θ1=30)
+    assert result['θ2'] == pytest.approx(expected['θ2'])
+    # None arguments become NaN, i.e. unknown
+    assert np.isnan(result['I1']) and np.isnan(result['I2'])
+    assert not impossible
+
+
+def test_sound_waves_batch_matches_scalar():
+    rows = [
+        {'f_source': 500.0, 'v_source': 30.0},
+        {'f_source': 500.0, 'v_observer': 30.0},
+        {'f_source': 500.0, 'v_source': 30.0, 'θ_source': 60.0},
+        {'f_source': 500.0, 'v_source': 30.0, 'v_observer': 20.0},
+        {'f_source': 500.0, 'v_source': 100.0, 'v_medium': 1500.0},
+        # An angled observer alone has no formula, so nothing is observed
+        {'f_source': 500.0, 'v_observer': 30.0, 'θ_observer': 45.0},
+        # Sonic boom, head-on and along the angled component
+        {'f_source': 500.0, 'v_source': 343.0},
+        {'f_source': 500.0, 'v_source': 686.0, 'θ_source': 60.0},
+    ]
+    columns = _batch_columns(
+        rows, ('f_source', 'v_source', 'v_observer', 'θ_source', 'θ_observer'))
+    columns['v_medium'] = np.array([row.get('v_medium', 343.0) for row in rows])
+    result, impossible = solve_sound_waves_batch(**columns)
+    assert impossible.tolist() == [False] * 6 + [True, True]
+
+    for i, row in enumerate(rows):
+        try:
+            expected = solve_sound_waves(**row)
+        except PhysicsConfigurationError:
+            assert impossible[i], i
+            assert np.isnan(result['f_observed'][i]), i
+            continue
+        assert not impossible[i], i
+        if 'f_observed' in expected:
+            assert result['f_observed'][i] == pytest.approx(expected['f_observed']), i
+        else:
+            assert np.isnan(result['f_observed'][i]), i
+        for name in ('f_source', 'v_source', 'v_observer'):
+            if name in row:
+                assert result[name][i] == row[name], (i, name)
+            else:
+                assert np.isnan(result[name][i]), (i, name)
@@ -3,22 +3,97 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                             QLineEdit, QPushButton, QGroupBox, QFormLayout,
                             QMessageBox, QComboBox, QTabWidget)
 from PyQt6.QtCore import Qt
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
 import numpy as np
 from core.advanced_mechanics import (solve_projectile_motion, solve_circular_motion,
                                     solve_banked_tracks, solve_gravitation,
                                     InputValidationError, InsufficientDataError)
 from PyQt6.QtGui import QFont, QColor
 from matplotlib.patches import Circle, Arrow, FancyArrowPatch
-import math
+import functools
+from math import radians, cos, sin, sqrt, pi
+
+G = 6.67430e-11  # Gravitational constant (N·m²/kg²)
+g0 = 9.81  # Gravitational acceleration at Earth's surface (m/s²)
+
+# Sample grids shared by every plot, scaled per call
+_UNIT_T = np.linspace(0.0, 1.0, 100)
+_SYM_T = np.linspace(-1.0, 1.0, 100)
+
+TAB_STYLE = """
+    QWidget {
+        background-color: #222222;
+        color: #EEEEEE;
+        font-family: Segoe UI, Arial;
+    }
+    QGroupBox {
+        font: bold 14px;
+        border: 2px solid #3A7CA5;
+        border-radius: 5px;
+        margin-top: 1ex;
+        background-color: #333333;
+        padding-top: 12px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 3px;
+        color: #3A7CA5;
+    }
+    QPushButton {
+        background-color: #3A7CA5;
+        color: white;
+        border: none;
+        padding: 6px 12px;
+        border-radius: 4px;
+        font-weight: bold;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #2F6690;
+    }
+    QPushButton:disabled {
+        background-color: #666666;
+    }
+    QLineEdit, QComboBox {
+        border: 1px solid #3A7CA5;
+        padding: 5px;
+        border-radius: 3px;
+        background-color: #444444;
+        color: white;
+        selection-background-color: #3A7CA5;
+    }
+    QLabel {
+        color: #EEEEEE;
+        font-size: 13px;
+    }
+"""
+
+@functools.lru_cache(maxsize=128)
+def _solve_cached(solver, inputs):
+    """Solve once per distinct set of inputs; the core solvers are pure"""
+    return solver(**dict(inputs))
+
+def _cached_solve(solver, values):
+    # Copy so callers can't mutate the cached result
+    return dict(_solve_cached(solver, tuple(values.items())))
 
 class BaseAdvancedMechanicsTab(QWidget):
-    def __init__(self, title, parent=None):
+    # (var, label, unit options) for each input row, set by subclasses
+    INPUT_SPEC = ()
+    # var -> {unit text: factor to SI}; units not listed are already SI
+    UNIT_FACTORS = {}
+    
+    def __init__(self, title, parent=None, canvas=None):
         super().__init__(parent)
+        self.canvas = canvas  # shared canvas from AdvancedMechanicsTab, if any
         self.dark_mode = False
         self.last_result = None
         self.title = title
+        self._parsed = {}  # var -> (text, value) from the last parse
+        self.factors = {}  # var -> factor for the currently selected unit
+        self.legend_artists = []  # artists the current legend was built for
         self.initUI()
     
     def initUI(self):
@@ -51,9 +126,13 @@ class BaseAdvancedMechanicsTab(QWidget):
         input_layout.addRow(button_layout)
         input_layout.addRow(self.result_display)
         
-        # Right panel for plot
-        self.figure, self.ax = plt.subplots()
-        self.canvas = FigureCanvas(self.figure)
+        # Right panel for plot; with a shared canvas this tab gets its own axes on it
+        if self.canvas is None:
+            # Plain Figure: no pyplot figure manager, no automatic layout pass per draw
+            self.canvas = FigureCanvas(Figure(layout=None))
+        self.figure = self.canvas.figure
+        self.ax = self.figure.add_subplot(111)
+        self.create_artists()
         
         # Add panels to main layout
         input_panel.setLayout(input_layout)
@@ -65,58 +144,69 @@ class BaseAdvancedMechanicsTab(QWidget):
         self.connect_signals()
     
     def create_input_fields(self, layout):
-        """To be implemented by subclasses"""
-        pass
+        """Add a value field and unit selector per INPUT_SPEC row"""
+        self.inputs = {}
+        self.unit_combos = {}
+        
+        for var, label, units in self.INPUT_SPEC:
+            self.inputs[var] = QLineEdit()
+            unit_combo = QComboBox()
+            unit_combo.addItems(units)
+            hbox = QHBoxLayout()
+            hbox.addWidget(self.inputs[var])
+            hbox.addWidget(unit_combo)
+            layout.addRow(label, hbox)
+            self.unit_combos[var] = unit_combo
+            self.track_unit(var, unit_combo)
+    
+    def track_unit(self, var, unit_combo):
+        """Keep self.factors[var] in step with the unit selected in unit_combo"""
+        factors = self.UNIT_FACTORS.get(var, {})
+        def update(index):
+            self.factors[var] = factors.get(unit_combo.itemText(index), 1.0)
+        unit_combo.currentIndexChanged.connect(update)
+        update(unit_combo.currentIndex())
+    
+    def convert_units(self, values):
+        """Convert entered values to SI in place"""
+        for var, factor in self.factors.items():
+            if factor != 1.0 and values.get(var) is not None:
+                values[var] *= factor
+    
+    def create_artists(self):
+        """To be implemented by subclasses: build the plot's artists once, hidden.
+        plot() then only updates their data instead of rebuilding the axes."""
+        self.plot_artists = []
+    
+    def hide_artists(self):
+        for artist in self.plot_artists:
+            artist.set_visible(False)
+    
+    def show_artists(self, shown):
+        """Show only the given artists, with a legend for the labelled ones"""
+        for artist in self.plot_artists:
+            artist.set_visible(artist in shown)
+        
+        handles = [a for a in shown if a.get_label() and not a.get_label().startswith('_')]
+        legend = self.ax.get_legend()
+        if legend is not None and handles == self.legend_artists:
+            # Same entries as last time: only the values in the labels can differ
+            for text, handle in zip(legend.get_texts(), handles):
+                text.set_text(handle.get_label())
+        else:
+            self.ax.legend(handles=handles)
+            self.legend_artists = handles
+        self.canvas.draw_idle()
     
     def apply_style(self):
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #222222;
-                color: #EEEEEE;
-                font-family: Segoe UI, Arial;
-            }
-            QGroupBox {
-                font: bold 14px;
-                border: 2px solid #3A7CA5;
-                border-radius: 5px;
-                margin-top: 1ex;
-                background-color: #333333;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 3px;
-                color: #3A7CA5;
-            }
-            QPushButton {
-                background-color: #3A7CA5;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 4px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #2F6690;
-            }
-            QPushButton:disabled {
-                background-color: #666666;
-            }
-            QLineEdit, QComboBox {
-                border: 1px solid #3A7CA5;
-                padding: 5px;
-                border-radius: 3px;
-                background-color: #444444;
-                color: white;
-                selection-background-color: #3A7CA5;
-            }
-            QLabel {
-                color: #EEEEEE;
-                font-size: 13px;
-            }
-        """)
+        # Widget styling comes from TAB_STYLE, set once on AdvancedMechanicsTab
+        self.update_plot_theme()
+    
+    def activate(self):
+        """Take over the shared canvas: move it into this tab and show only our axes"""
+        for ax in self.figure.axes:
+            ax.set_visible(ax is self.ax)
+        self.layout().addWidget(self.canvas, 1)
         self.update_plot_theme()
     
     def update_plot_theme(self):
@@ -132,7 +222,7 @@ class BaseAdvancedMechanicsTab(QWidget):
             for text in [self.ax.title, self.ax.xaxis.label, self.ax.yaxis.label] + self.ax.texts:
                 text.set_color('#333333')
             self.ax.grid(color='#DDDDDD')
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def connect_signals(self):
         self.calculate_btn.clicked.connect(self.calculate)
@@ -153,10 +243,21 @@ class BaseAdvancedMechanicsTab(QWidget):
         values = {}
         for var, field in self.inputs.items():
             text = field.text().strip()
+            if not text:
+                values[var] = None
+                continue
+            
+            # Only re-parse fields whose text changed since the last Calculate
+            cached = self._parsed.get(var)
+            if cached is not None and cached[0] == text:
+                values[var] = cached[1]
+                continue
             try:
-                values[var] = float(text) if text else None
+                value = float(text)
             except ValueError:
-                values[var] = None
+                value = None
+            self._parsed[var] = (text, value)
+            values[var] = value
         return values
     
     def clear_fields(self):
@@ -165,8 +266,8 @@ class BaseAdvancedMechanicsTab(QWidget):
         self.result_display.setText("Results will appear here...")
         self.last_result = None
         self.ax.clear()
+        self.create_artists()
         self.update_plot_theme()
-        self.canvas.draw()
     
     def plot(self):
         """To be implemented by subclasses"""
@@ -188,61 +289,61 @@ class BaseAdvancedMechanicsTab(QWidget):
             return f"Calculation error: {str(e)}"
 
 class ProjectileMotionTab(BaseAdvancedMechanicsTab):
-    def __init__(self, parent=None):
-        super().__init__("Projectile Motion Calculator", parent)
+    INPUT_SPEC = (
+        ('u', "Initial velocity (u)", ["m/s", "km/h"]),
+        ('θ', "Launch angle (θ)", ["°"]),
+        ('ux', "Horizontal velocity (uₓ)", ["m/s"]),
+        ('uy', "Vertical velocity (uᵧ)", ["m/s"]),
+        ('t_flight', "Time of flight (t)", ["s"]),
+        ('max_height', "Max height (h)", ["m"]),
+        ('range', "Range (R)", ["m"]),
+    )
     
-    def create_input_fields(self, layout):
-        units = {
-            'u': ["m/s", "km/h"],
-            'θ': ["°"],
-            'ux': ["m/s"],
-            'uy': ["m/s"],
-            't_flight': ["s"],
-            'max_height': ["m"],
-            'range': ["m"]
-        }
-        
-        symbols = {
-            'u': "Initial velocity (u)",
-            'θ': "Launch angle (θ)",
-            'ux': "Horizontal velocity (uₓ)",
-            'uy': "Vertical velocity (uᵧ)",
-            't_flight': "Time of flight (t)",
-            'max_height': "Max height (h)",
-            'range': "Range (R)"
-        }
-        
-        self.inputs = {}
-        self.unit_combos = {}
+    UNIT_FACTORS = {
+        'u': {"km/h": 1000 / 3600},
+    }
+    
+    def __init__(self, parent=None, canvas=None):
+        super().__init__("Projectile Motion Calculator", parent, canvas)
+        # Trajectory buffers reused by every plot()
+        self._t_scaled = np.empty(100)
+        self._x = np.empty(100)
+        self._y = np.empty(100)
+    
+    def create_artists(self):
+        self.trajectory_line, = self.ax.plot([], [], 'b-', label='Trajectory')
+        self.launch_point, = self.ax.plot([], [], 'ro', label='Launch')
+        self.landing_point, = self.ax.plot([], [], 'go', label='Landing')
+        self.peak_point, = self.ax.plot([], [], 'yo', label='Max height')
+        self.plot_artists = [self.trajectory_line, self.launch_point, self.landing_point, self.peak_point]
+        self.hide_artists()
         
-        for var in ['u', 'θ', 'ux', 'uy', 't_flight', 'max_height', 'range']:
-            self.inputs[var] = QLineEdit()
-            unit_combo = QComboBox()
-            unit_combo.addItems(units.get(var, [""]))
-            hbox = QHBoxLayout()
-            hbox.addWidget(self.inputs[var])
-            hbox.addWidget(unit_combo)
-            layout.addRow(symbols[var], hbox)
-            self.unit_combos[var] = unit_combo
+        self.ax.set_xlabel('Horizontal distance (m)')
+        self.ax.set_ylabel('Vertical distance (m)')
+        self.ax.set_title('Projectile Motion')
     
     def calculate(self):
         values = self.get_input_values()
+        self.convert_units(values)
         
-        # Convert units
-        if values.get('u') is not None and self.unit_combos['u'].currentText() == "km/h":
-            values['u'] = values['u'] * 1000 / 3600  # km/h to m/s
-            
         try:
-            result = solve_projectile_motion(**values)
+            result = _cached_solve(solve_projectile_motion, values)
             self.last_result = result
             
             # Display results
-            result_text = "📊 Results:\n"
-            for var, val in result.items():
-                if val is not None:
-                    result_text += f"• {var}: {val:.3f} {self.unit_combos[var].currentText()}\n"
+            lines = ["📊 Results:"]
+            lines.extend(f"• {var}: {val:.3f} {self.unit_combos[var].currentText()}"
+                         for var, val in result.items() if val is not None)
+            self.result_display.setText("\n".join(lines))
             
-            self.result_display.setText(result_text)
+            # Fill in anything plot() needs that the solver didn't return, once
+            if result.get('u') is not None and result.get('θ') is not None:
+                θ = radians(result['θ'])
+                result.setdefault('ux', result['u'] * cos(θ))
+                result.setdefault('uy', result['u'] * sin(θ))
+                result.setdefault('t_flight', 2 * result['uy'] / g0)
+                result.setdefault('max_height', (result['uy'] ** 2) / (2 * g0))
+                result.setdefault('range', result['ux'] * result['t_flight'])
             
         except Exception as e:
             error_msg = self.handle_calculation_error(e)
@@ -259,104 +360,76 @@ class ProjectileMotionTab(BaseAdvancedMechanicsTab):
             QMessageBox.warning(self, "Missing Data", "Need initial velocity and angle to plot trajectory.")
             return
         
-        u = result['u']
-        θ = math.radians(result['θ'])
-        ux = u * math.cos(θ)
-        uy = u * math.sin(θ)
-        t_flight = result.get('t_flight', 2 * uy / 9.81)
-        max_height = result.get('max_height', (uy ** 2) / (2 * 9.81))
-        range_val = result.get('range', ux * t_flight)
-        
-        # Clear and style plot
-        self.ax.clear()
-        self.update_plot_theme()
-        
-        # Calculate trajectory
-        t = np.linspace(0, t_flight, 100)
-        x = ux * t
-        y = uy * t - 0.5 * 9.81 * t ** 2
-        
-        # Plot trajectory
-        self.ax.plot(x, y, 'b-', label='Trajectory')
-        
-        # Mark important points
-        self.ax.plot(0, 0, 'ro', label='Launch')
-        self.ax.plot(range_val, 0, 'go', label='Landing')
-        self.ax.plot(ux * t_flight/2, max_height, 'yo', label='Max height')
+        # Derived values were filled in by calculate()
+        ux, uy = result['ux'], result['uy']
+        t_flight = result['t_flight']
+        max_height = result['max_height']
+        range_val = result['range']
+        
+        # Calculate trajectory in place: x = ux·t, y = (uy - ½g·t)·t
+        t = np.multiply(_UNIT_T, t_flight, out=self._t_scaled)
+        x = np.multiply(t, ux, out=self._x)
+        y = np.multiply(t, -0.5 * g0, out=self._y)
+        y += uy
+        y *= t
+        
+        # Update trajectory and important points
+        self.trajectory_line.set_data(x, y)
+        self.launch_point.set_data([0], [0])
+        self.landing_point.set_data([range_val], [0])
+        self.peak_point.set_data([ux * t_flight/2], [max_height])
         
-        # Add labels and title
         self.ax.set_xlim(0, range_val * 1.1)
         self.ax.set_ylim(0, max_height * 1.2)
-        self.ax.set_xlabel('Horizontal distance (m)')
-        self.ax.set_ylabel('Vertical distance (m)')
-        self.ax.set_title('Projectile Motion')
-        self.ax.legend()
-        self.ax.grid(True)
-        
-        self.canvas.draw()
+        self.show_artists(self.plot_artists)
 
 class CircularMotionTab(BaseAdvancedMechanicsTab):
-    def __init__(self, parent=None):
-        super().__init__("Circular Motion Calculator", parent)
+    INPUT_SPEC = (
+        ('v', "Linear velocity (v)", ["m/s", "km/h"]),
+        ('r', "Radius (r)", ["m", "km"]),
+        ('T', "Period (T)", ["s", "min"]),
+        ('f', "Frequency (f)", ["Hz"]),
+        ('ω', "Angular velocity (ω)", ["rad/s"]),
+        ('a_c', "Centripetal accel (a_c)", ["m/s²"]),
+        ('F_c', "Centripetal force (F_c)", ["N"]),
+        ('m', "Mass (m)", ["kg"]),
+    )
     
-    def create_input_fields(self, layout):
-        units = {
-            'v': ["m/s", "km/h"],
-            'r': ["m", "km"],
-            'T': ["s", "min"],
-            'f': ["Hz"],
-            'ω': ["rad/s"],
-            'a_c': ["m/s²"],
-            'F_c': ["N"],
-            'm': ["kg"]
-        }
-        
-        symbols = {
-            'v': "Linear velocity (v)",
-            'r': "Radius (r)",
-            'T': "Period (T)",
-            'f': "Frequency (f)",
-            'ω': "Angular velocity (ω)",
-            'a_c': "Centripetal accel (a_c)",
-            'F_c': "Centripetal force (F_c)",
-            'm': "Mass (m)"
-        }
-        
-        self.inputs = {}
-        self.unit_combos = {}
+    UNIT_FACTORS = {
+        'v': {"km/h": 1000 / 3600},
+        'r': {"km": 1000},
+        'T': {"min": 60},
+    }
+    
+    def __init__(self, parent=None, canvas=None):
+        super().__init__("Circular Motion Calculator", parent, canvas)
+    
+    def create_artists(self):
+        self.path_circle = Circle((0, 0), 1, fill=False, color='b')
+        self.ax.add_artist(self.path_circle)
+        self.velocity_arrow = self.ax.arrow(0, 0, 0, 0, fc='r', ec='r')
+        self.force_arrow = self.ax.arrow(0, 0, 0, 0, fc='g', ec='g')
+        self.plot_artists = [self.path_circle, self.velocity_arrow, self.force_arrow]
+        self.hide_artists()
         
-        for var in ['v', 'r', 'T', 'f', 'ω', 'a_c', 'F_c', 'm']:
-            self.inputs[var] = QLineEdit()
-            unit_combo = QComboBox()
-            unit_combo.addItems(units.get(var, [""]))
-            hbox = QHBoxLayout()
-            hbox.addWidget(self.inputs[var])
-            hbox.addWidget(unit_combo)
-            layout.addRow(symbols[var], hbox)
-            self.unit_combos[var] = unit_combo
+        self.ax.set_aspect('equal')
+        self.ax.set_xlabel('Position (m)')
+        self.ax.set_ylabel('Position (m)')
+        self.ax.set_title('Uniform Circular Motion')
     
     def calculate(self):
         values = self.get_input_values()
+        self.convert_units(values)
         
-        # Convert units
-        if values.get('v') is not None and self.unit_combos['v'].currentText() == "km/h":
-            values['v'] = values['v'] * 1000 / 3600  # km/h to m/s
-        if values.get('r') is not None and self.unit_combos['r'].currentText() == "km":
-            values['r'] = values['r'] * 1000  # km to m
-        if values.get('T') is not None and self.unit_combos['T'].currentText() == "min":
-            values['T'] = values['T'] * 60  # min to s
-            
         try:
-            result = solve_circular_motion(**values)
+            result = _cached_solve(solve_circular_motion, values)
             self.last_result = result
             
             # Display results
-            result_text = "📊 Results:\n"
-            for var, val in result.items():
-                if val is not None:
-                    result_text += f"• {var}: {val:.3f} {self.unit_combos[var].currentText()}\n"
-            
-            self.result_display.setText(result_text)
+            lines = ["📊 Results:"]
+            lines.extend(f"• {var}: {val:.3f} {self.unit_combos[var].currentText()}"
+                         for var, val in result.items() if val is not None)
+            self.result_display.setText("\n".join(lines))
             
         except Exception as e:
             error_msg = self.handle_calculation_error(e)
@@ -376,89 +449,68 @@ class CircularMotionTab(BaseAdvancedMechanicsTab):
         v = result['v']
         r = result['r']
         ω = result.get('ω', v / r)
-        T = result.get('T', 2 * math.pi / ω if ω is not None else None)
-        
-        # Clear and style plot
-        self.ax.clear()
-        self.update_plot_theme()
+        T = result.get('T', 2 * pi / ω if ω is not None else None)
         
         # Draw circle
-        circle = plt.Circle((0, 0), r, fill=False, color='b')
-        self.ax.add_artist(circle)
+        self.path_circle.set_radius(r)
+        shown = [self.path_circle, self.velocity_arrow]
         
         # Draw velocity vector
-        self.ax.arrow(0, r, v, 0, head_width=0.1*r, head_length=0.1*r, fc='r', ec='r', label=f'Velocity: {v:.1f} m/s')
+        self.velocity_arrow.set_data(x=0, y=r, dx=v, dy=0, head_width=0.1*r, head_length=0.1*r)
+        self.velocity_arrow.set_label(f'Velocity: {v:.1f} m/s')
         
         # Draw centripetal force vector
         if result.get('F_c') is not None:
-            self.ax.arrow(0, r, 0, -0.5, head_width=0.1*r, head_length=0.1*r, fc='g', ec='g', label=f'Centripetal force: {result["F_c"]:.1f} N')
+            self.force_arrow.set_data(x=0, y=r, dx=0, dy=-0.5, head_width=0.1*r, head_length=0.1*r)
+            self.force_arrow.set_label(f'Centripetal force: {result["F_c"]:.1f} N')
+            shown.append(self.force_arrow)
         
-        # Add labels
         self.ax.set_xlim(-1.2*r, 1.2*r)
         self.ax.set_ylim(-1.2*r, 1.2*r)
-        self.ax.set_aspect('equal')
-        self.ax.set_xlabel('Position (m)')
-        self.ax.set_ylabel('Position (m)')
-        self.ax.set_title('Uniform Circular Motion')
-        self.ax.legend()
-        self.ax.grid(True)
-        
-        self.canvas.draw()
+        self.show_artists(shown)
 
 class BankedTracksTab(BaseAdvancedMechanicsTab):
-    def __init__(self, parent=None):
-        super().__init__("Banked Tracks Calculator", parent)
+    INPUT_SPEC = (
+        ('θ', "Bank angle (θ)", ["°"]),
+        ('v', "Velocity (v)", ["m/s", "km/h"]),
+        ('r', "Radius (r)", ["m"]),
+        ('μ', "Friction coeff (μ)", [""]),
+        ('v_min', "Min safe speed", ["m/s"]),
+        ('v_max', "Max safe speed", ["m/s"]),
+    )
     
-    def create_input_fields(self, layout):
-        units = {
-            'θ': ["°"],
-            'v': ["m/s", "km/h"],
-            'r': ["m"],
-            'μ': [""],
-            'v_min': ["m/s"],
-            'v_max': ["m/s"]
-        }
-        
-        symbols = {
-            'θ': "Bank angle (θ)",
-            'v': "Velocity (v)",
-            'r': "Radius (r)",
-            'μ': "Friction coeff (μ)",
-            'v_min': "Min safe speed",
-            'v_max': "Max safe speed"
-        }
-        
-        self.inputs = {}
-        self.unit_combos = {}
+    UNIT_FACTORS = {
+        'v': {"km/h": 1000 / 3600},
+    }
+    
+    def __init__(self, parent=None, canvas=None):
+        super().__init__("Banked Tracks Calculator", parent, canvas)
+    
+    def create_artists(self):
+        self.track_line, = self.ax.plot([], [], 'b-', linewidth=3, label='Banked track')
+        self.normal_arrow = self.ax.arrow(0, 0, 0, 0, fc='g', ec='g', label='Normal force')
+        self.friction_arrow = self.ax.arrow(0, 0, 0, 0, fc='r', ec='r', label='Friction force')
+        self.plot_artists = [self.track_line, self.normal_arrow, self.friction_arrow]
+        self.hide_artists()
         
-        for var in ['θ', 'v', 'r', 'μ', 'v_min', 'v_max']:
-            self.inputs[var] = QLineEdit()
-            unit_combo = QComboBox()
-            unit_combo.addItems(units.get(var, [""]))
-            hbox = QHBoxLayout()
-            hbox.addWidget(self.inputs[var])
-            hbox.addWidget(unit_combo)
-            layout.addRow(symbols[var], hbox)
-            self.unit_combos[var] = unit_combo
+        self.ax.set_aspect('equal')
+        self.ax.set_xlabel('Position (m)')
+        self.ax.set_ylabel('Height (m)')
+        self.ax.set_title('Banked Track')
     
     def calculate(self):
         values = self.get_input_values()
+        self.convert_units(values)
         
-        # Convert units
-        if values.get('v') is not None and self.unit_combos['v'].currentText() == "km/h":
-            values['v'] = values['v'] * 1000 / 3600  # km/h to m/s
-            
         try:
-            result = solve_banked_tracks(**values)
+            result = _cached_solve(solve_banked_tracks, values)
             self.last_result = result
             
             # Display results
-            result_text = "📊 Results:\n"
-            for var, val in result.items():
-                if val is not None:
-                    result_text += f"• {var}: {val:.3f} {self.unit_combos[var].currentText()}\n"
-            
-            self.result_display.setText(result_text)
+            lines = ["📊 Results:"]
+            lines.extend(f"• {var}: {val:.3f} {self.unit_combos[var].currentText()}"
+                         for var, val in result.items() if val is not None)
+            self.result_display.setText("\n".join(lines))
             
         except Exception as e:
             error_msg = self.handle_calculation_error(e)
@@ -476,18 +528,15 @@ class BankedTracksTab(BaseAdvancedMechanicsTab):
             QMessageBox.warning(self, "Missing Data", "Need bank angle and radius to plot banked track.")
             return
         
-        θ = math.radians(result['θ'])
+        θ = radians(result['θ'])
         r = result['r']
         
-        # Clear and style plot
-        self.ax.clear()
-        self.update_plot_theme()
-        
         # Draw banked track
-        x = np.linspace(-r, r, 100)
+        x = _SYM_T * r
         y = np.tan(θ) * x
         
-        self.ax.plot(x, y, 'b-', linewidth=3, label='Banked track')
+        self.track_line.set_data(x, y)
+        shown = [self.track_line]
         
         # Draw car
         car_x = 0
@@ -499,95 +548,69 @@ class BankedTracksTab(BaseAdvancedMechanicsTab):
         if result.get('v') is not None:
             v = result['v']
             # Normal force
-            self.ax.arrow(car_x, car_y, 0, 0.5, head_width=0.1*r, head_length=0.1*r, fc='g', ec='g', label='Normal force')
+            self.normal_arrow.set_data(x=car_x, y=car_y, dx=0, dy=0.5, head_width=0.1*r, head_length=0.1*r)
             # Friction force
-            self.ax.arrow(car_x, car_y, 0.3, 0, head_width=0.1*r, head_length=0.1*r, fc='r', ec='r', label='Friction force')
+            self.friction_arrow.set_data(x=car_x, y=car_y, dx=0.3, dy=0, head_width=0.1*r, head_length=0.1*r)
+            shown += [self.normal_arrow, self.friction_arrow]
         
-        # Add labels
         self.ax.set_xlim(-1.2*r, 1.2*r)
         self.ax.set_ylim(-0.5*r, 1.5*r)
-        self.ax.set_aspect('equal')
-        self.ax.set_xlabel('Position (m)')
-        self.ax.set_ylabel('Height (m)')
-        self.ax.set_title(f'Banked Track (θ={math.degrees(θ):.1f}°)')
-        self.ax.legend()
-        self.ax.grid(True)
-        
-        self.canvas.draw()
+        self.ax.set_title(f'Banked Track (θ={result["θ"]:.1f}°)')
+        self.show_artists(shown)
 
 class GravitationTab(BaseAdvancedMechanicsTab):
-    def __init__(self, parent=None):
-        super().__init__("Gravitation Calculator", parent)
+    INPUT_SPEC = (
+        ('M', "Primary mass (M)", ["kg", "M⊕"]),
+        ('m', "Secondary mass (m)", ["kg"]),
+        ('r', "Distance (r)", ["m", "km"]),
+        ('F_g', "Grav force (F_g)", ["N"]),
+        ('g', "Grav field (g)", ["m/s²"]),
+        ('v_orbital', "Orbital velocity", ["m/s", "km/s"]),
+        ('T', "Orbital period", ["s", "h", "d"]),
+        ('altitude', "Altitude", ["m", "km"]),
+    )
     
-    def create_input_fields(self, layout):
-        units = {
-            'M': ["kg", "M⊕"],
-            'm': ["kg"],
-            'r': ["m", "km"],
-            'F_g': ["N"],
-            'g': ["m/s²"],
-            'v_orbital': ["m/s", "km/s"],
-            'T': ["s", "h", "d"],
-            'altitude': ["m", "km"]
-        }
-        
-        symbols = {
-            'M': "Primary mass (M)",
-            'm': "Secondary mass (m)",
-            'r': "Distance (r)",
-            'F_g': "Grav force (F_g)",
-            'g': "Grav field (g)",
-            'v_orbital': "Orbital velocity",
-            'T': "Orbital period",
-            'altitude': "Altitude"
-        }
-        
-        self.inputs = {}
-        self.unit_combos = {}
+    UNIT_FACTORS = {
+        'M': {"M⊕": 5.972e24},  # Earth masses
+        'r': {"km": 1000},
+        'v_orbital': {"km/s": 1000},
+        'T': {"h": 3600, "d": 86400},
+        'altitude': {"km": 1000},
+    }
+    
+    def __init__(self, parent=None, canvas=None):
+        super().__init__("Gravitation Calculator", parent, canvas)
+    
+    def create_artists(self):
+        self.central_mass = Circle((0, 0), 1, color='r')
+        self.orbit_circle = Circle((0, 0), 1, fill=False, color='b')
+        self.ax.add_artist(self.central_mass)
+        self.ax.add_artist(self.orbit_circle)
+        self.velocity_arrow = self.ax.arrow(0, 0, 0, 0, fc='g', ec='g')
+        self.plot_artists = [self.central_mass, self.orbit_circle, self.velocity_arrow]
+        self.hide_artists()
         
-        for var in ['M', 'm', 'r', 'F_g', 'g', 'v_orbital', 'T', 'altitude']:
-            self.inputs[var] = QLineEdit()
-            unit_combo = QComboBox()
-            unit_combo.addItems(units.get(var, [""]))
-            hbox = QHBoxLayout()
-            hbox.addWidget(self.inputs[var])
-            hbox.addWidget(unit_combo)
-            layout.addRow(symbols[var], hbox)
-            self.unit_combos[var] = unit_combo
+        self.ax.set_aspect('equal')
+        self.ax.set_xlabel('Position (m)')
+        self.ax.set_ylabel('Position (m)')
+        self.ax.set_title('Gravitational Field and Orbit')
     
     def calculate(self):
         values = self.get_input_values()
+        self.convert_units(values)
         
-        # Convert units
-        if values.get('M') is not None and self.unit_combos['M'].currentText() == "M⊕":
-            values['M'] = values['M'] * 5.972e24  # Earth masses to kg
-        if values.get('r') is not None and self.unit_combos['r'].currentText() == "km":
-            values['r'] = values['r'] * 1000  # km to m
-        if values.get('v_orbital') is not None and self.unit_combos['v_orbital'].currentText() == "km/s":
-            values['v_orbital'] = values['v_orbital'] * 1000  # km/s to m/s
-        if values.get('T') is not None:
-            if self.unit_combos['T'].currentText() == "h":
-                values['T'] = values['T'] * 3600  # hours to seconds
-            elif self.unit_combos['T'].currentText() == "d":
-                values['T'] = values['T'] * 86400  # days to seconds
-        if values.get('altitude') is not None and self.unit_combos['altitude'].currentText() == "km":
-            values['altitude'] = values['altitude'] * 1000  # km to m
-            
         try:
-            result = solve_gravitation(**values)
+            result = _cached_solve(solve_gravitation, values)
             self.last_result = result
             
             # Display results
-            result_text = "📊 Results:\n"
+            lines = ["📊 Results:"]
             for var, val in result.items():
                 if val is not None:
                     # Use scientific notation for very large/small numbers in gravitation
-                    if abs(val) > 1e4 or abs(val) < 1e-4:
-                        result_text += f"• {var}: {val:.3e} {self.unit_combos[var].currentText()}\n"
-                    else:
-                        result_text += f"• {var}: {val:.3f} {self.unit_combos[var].currentText()}\n"
-            
-            self.result_display.setText(result_text)
+                    fmt = ".3e" if abs(val) > 1e4 or abs(val) < 1e-4 else ".3f"
+                    lines.append(f"• {var}: {val:{fmt}} {self.unit_combos[var].currentText()}")
+            self.result_display.setText("\n".join(lines))
             
         except Exception as e:
             error_msg = self.handle_calculation_error(e)
@@ -606,38 +629,37 @@ class GravitationTab(BaseAdvancedMechanicsTab):
         
         M = result['M']
         r = result['r']
-        v_orbital = result.get('v_orbital', math.sqrt(6.67430e-11 * M / r))
-        
-        # Clear and style plot
-        self.ax.clear()
-        self.update_plot_theme()
+        v_orbital = result.get('v_orbital', sqrt(G * M / r))
         
         # Draw central mass
         central_size = min(0.1 * r, 0.5)  # Limit size for visibility
-        self.ax.add_artist(plt.Circle((0, 0), central_size, color='r', label=f'Mass: {M:.1e} kg'))
+        self.central_mass.set_radius(central_size)
+        self.central_mass.set_label(f'Mass: {M:.1e} kg')
         
         # Draw orbit
-        orbit = plt.Circle((0, 0), r, fill=False, color='b', label=f'Orbit: {r:.1e} m')
-        self.ax.add_artist(orbit)
+        self.orbit_circle.set_radius(r)
+        self.orbit_circle.set_label(f'Orbit: {r:.1e} m')
+        shown = [self.central_mass, self.orbit_circle]
         
         # Draw orbital velocity if available
         if v_orbital is not None:
-            self.ax.arrow(0, r, v_orbital/1000, 0, head_width=0.05*r, head_length=0.05*r, 
-                         fc='g', ec='g', label=f'Orbital velocity: {v_orbital:.1f} m/s')
+            self.velocity_arrow.set_data(x=0, y=r, dx=v_orbital/1000, dy=0, head_width=0.05*r, head_length=0.05*r)
+            self.velocity_arrow.set_label(f'Orbital velocity: {v_orbital:.1f} m/s')
+            shown.append(self.velocity_arrow)
         
-        # Add labels
         self.ax.set_xlim(-1.2*r, 1.2*r)
         self.ax.set_ylim(-1.2*r, 1.2*r)
-        self.ax.set_aspect('equal')
-        self.ax.set_xlabel('Position (m)')
-        self.ax.set_ylabel('Position (m)')
-        self.ax.set_title('Gravitational Field and Orbit')
-        self.ax.legend()
-        self.ax.grid(True)
-        
-        self.canvas.draw()
+        self.show_artists(shown)
 
 class AdvancedMechanicsTab(QWidget):
+    # (attribute, class, title) for each sub-tab, in tab order
+    SUB_TABS = [
+        ('projectile_tab', ProjectileMotionTab, "Projectile Motion"),
+        ('circular_tab', CircularMotionTab, "Circular Motion"),
+        ('banked_tab', BankedTracksTab, "Banked Tracks"),
+        ('gravitation_tab', GravitationTab, "Gravitation"),
+    ]
+    
     def __init__(self):
         super().__init__()
         self.initUI()
@@ -663,19 +685,20 @@ class AdvancedMechanicsTab(QWidget):
         """)
         layout.addWidget(return_btn)
         
-        # Create tab widget
+        # Create tab widget; its stylesheet is inherited by every sub-tab
         self.tabs = QTabWidget()
+        self.tabs.setStyleSheet(TAB_STYLE)
         
-        # Create and add sub-tabs
-        self.projectile_tab = ProjectileMotionTab()
-        self.circular_tab = CircularMotionTab()
-        self.banked_tab = BankedTracksTab()
-        self.gravitation_tab = GravitationTab()
+        # One canvas for all sub-tabs, moved into whichever is showing
+        self.canvas = FigureCanvas(Figure(layout=None))
         
-        self.tabs.addTab(self.projectile_tab, "Projectile Motion")
-        self.tabs.addTab(self.circular_tab, "Circular Motion")
-        self.tabs.addTab(self.banked_tab, "Banked Tracks")
-        self.tabs.addTab(self.gravitation_tab, "Gravitation")
+        # Only the first sub-tab is built up front; the rest get a placeholder
+        # until they're first selected
+        self.built_tabs = set()
+        for _, _, title in self.SUB_TABS:
+            self.tabs.addTab(QWidget(), title)
+        self.show_tab(0)
+        self.tabs.currentChanged.connect(self.show_tab)
         
         layout.addWidget(self.tabs)
         self.setLayout(layout)
@@ -683,5 +706,28 @@ class AdvancedMechanicsTab(QWidget):
         # Connect return button
         return_btn.clicked.connect(self.return_to_menu)
     
+    def show_tab(self, index):
+        if index < 0:
+            return
+        self.ensure_tab_built(index)
+        self.tabs.widget(index).activate()
+    
+    def ensure_tab_built(self, index):
+        if index in self.built_tabs:
+            return
+        attr, tab_class, title = self.SUB_TABS[index]
+        tab = tab_class(canvas=self.canvas)
+        setattr(self, attr, tab)
+        self.built_tabs.add(index)
+        
+        # Swapping the page moves the current index; don't build those tabs too
+        self.tabs.blockSignals(True)
+        placeholder = self.tabs.widget(index)
+        self.tabs.removeTab(index)
+        placeholder.deleteLater()
+        self.tabs.insertTab(index, tab, title)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+    
     def return_to_menu(self):
         self.parent().parent().return_to_menu()
\ No newline at end of file
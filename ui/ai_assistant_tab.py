@@ -1,11 +1,80 @@
+import functools
+import logging
+import threading
+from collections import OrderedDict
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QTextEdit, QPushButton, QLabel
+    QApplication, QWidget, QVBoxLayout, QTextEdit, QPushButton, QLabel
 )
-from PyQt6.QtCore import QThread, Qt, pyqtSignal
-from core.physics_ai.hf_mistral import PhysicsMistral
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, Qt, pyqtSignal
 from ui.particle_background import ParticleBackground
 
+logger = logging.getLogger(__name__)
+
 ENABLE_AI = True
+_FINAL_MARKER = "**Final Answer:**"  # Section every valid answer must contain
+
+# One PhysicsMistral for the whole app, created on first use
+_MODEL = None
+_MODEL_LOCK = threading.Lock()
+
+# Stylesheet for the whole tab, parsed once instead of per widget
+TAB_STYLE = """
+    QLabel#aiTitle {
+        color: #4FC3F7;
+        font-size: 22px;
+        font-weight: bold;
+        margin-bottom: 10px;
+    }
+    QTextEdit#aiInput, QTextEdit#aiResponse {
+        background-color: #1E2A38;
+        border: 1px solid #4FC3F7;
+        border-radius: 8px;
+        padding: 10px;
+    }
+    QTextEdit#aiInput {
+        color: #CFD8DC;
+        font-size: 14px;
+    }
+    QTextEdit#aiResponse {
+        color: #90A4AE;
+        font-size: 13px;
+    }
+    QPushButton#aiSubmit, QPushButton#aiBack {
+        background-color: #263646;
+        color: #CFD8DC;
+        border: 1px solid #4FC3F7;
+        border-radius: 6px;
+    }
+    QPushButton#aiSubmit {
+        padding: 8px 18px;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QPushButton#aiBack {
+        font-size: 13px;
+        padding: 6px 12px;
+    }
+    QPushButton#aiSubmit:hover, QPushButton#aiBack:hover {
+        background-color: #2F4254;
+    }
+"""
+
+# Questions run one at a time on a single reused thread
+_AI_POOL = QThreadPool()
+_AI_POOL.setMaxThreadCount(1)
+_AI_EXIT_WAIT_MS = 2000  # How long shutdown waits for a question already sent
+
+
+def get_physics_mistral():
+    """Return the shared PhysicsMistral, creating it if needed (safe from worker threads)"""
+    global _MODEL
+    with _MODEL_LOCK:
+        if _MODEL is None:
+            # Imported here so gradio_client loads on the loader thread, not while building the UI
+            from core.physics_ai.hf_mistral import PhysicsMistral
+            _MODEL = PhysicsMistral()
+        return _MODEL
+
 
 class ModelLoaderWorker(QThread):
     finished = pyqtSignal(object)  # Emits the loaded model
@@ -17,141 +86,105 @@ class ModelLoaderWorker(QThread):
 
     def run(self):
         try:
-            self.model = PhysicsMistral()
+            self.model = get_physics_mistral()
             self.finished.emit(self.model)
         except Exception as e:
             self.error.emit(str(e))
 
 
-class AIWorker(QThread):
-    finished = pyqtSignal(str)
-    error = pyqtSignal(str)
+class AIWorker(QRunnable):
+    class Signals(QObject):
+        finished = pyqtSignal(str)
+        error = pyqtSignal(str)
 
     def __init__(self, mistral, question):
         super().__init__()
+        self.signals = AIWorker.Signals()
         self.mistral = mistral
         self.question = question
 
     def run(self):
         try:
             response = self.mistral.analyze_question(self.question)
-            self.finished.emit(response)
+            self.signals.finished.emit(response)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
 class AIAssistantTab(QWidget):
+    MAX_CACHE = 128  # Answers kept for repeated questions
+
     def __init__(self):
         super().__init__()
-        self.mistral = None  # Don't load model immediately
+        self._answer_cache = OrderedDict()
+        self.mistral = _MODEL  # Shared model if another tab already loaded it, else loaded on first question
         self.worker = None
         self.model_loader = None
+        self._pending_question = None
 
         self.background = ParticleBackground(self)
         self.background.lower()
 
         self.init_ui()
 
+        # Child widgets get no closeEvent when the window closes, so also stop on app exit
+        QApplication.instance().aboutToQuit.connect(self.shutdown)
+
+        # Load the model in the background now so it is ready by the first question
+        if ENABLE_AI and self.mistral is None:
+            self._start_model_load()
+
     def resizeEvent(self, event):
         self.background.resize(self.size())
         super().resizeEvent(event)
 
     def init_ui(self):
+        self.setStyleSheet(TAB_STYLE)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(40, 30, 40, 20)
         layout.setSpacing(15)
 
         # Title
         title = QLabel("Welcome to your personal Physics AI assistant!")
-        title.setStyleSheet("""
-            QLabel {
-                color: #4FC3F7;
-                font-size: 22px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }
-        """)
+        title.setObjectName("aiTitle")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(title)
 
         # Question input
         self.question_input = QTextEdit()
+        self.question_input.setObjectName("aiInput")
         self.question_input.setPlaceholderText("Enter your physics question...")
         self.question_input.setMaximumHeight(100)
-        self.question_input.setStyleSheet("""
-            QTextEdit {
-                background-color: #1E2A38;
-                color: #CFD8DC;
-                border: 1px solid #4FC3F7;
-                border-radius: 8px;
-                padding: 10px;
-                font-size: 14px;
-            }
-        """)
         layout.addWidget(self.question_input)
 
         # Solve button
-        submit_btn = QPushButton("Solve")
-        submit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        submit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #263646;
-                color: #CFD8DC;
-                border: 1px solid #4FC3F7;
-                border-radius: 6px;
-                padding: 8px 18px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2F4254;
-            }
-        """)
-        submit_btn.clicked.connect(self.solve_question)
-        layout.addWidget(submit_btn)
+        self.submit_btn = QPushButton("Solve")
+        self.submit_btn.setObjectName("aiSubmit")
+        self.submit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.submit_btn.clicked.connect(self.solve_question)
+        layout.addWidget(self.submit_btn)
 
         # Response display
         self.response_display = QTextEdit()
+        self.response_display.setObjectName("aiResponse")
         self.response_display.setReadOnly(True)
-        self.response_display.setStyleSheet("""
-            QTextEdit {
-                background-color: #1E2A38;
-                color: #90A4AE;
-                border: 1px solid #4FC3F7;
-                border-radius: 8px;
-                padding: 10px;
-                font-size: 13px;
-            }
-        """)
         layout.addWidget(self.response_display)
 
         # Back button
         back_btn = QPushButton("← Back to Menu")
+        back_btn.setObjectName("aiBack")
         back_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         back_btn.setFixedWidth(140)
-        back_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #263646;
-                color: #CFD8DC;
-                border: 1px solid #4FC3F7;
-                border-radius: 6px;
-                font-size: 13px;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #2F4254;
-            }
-        """)
         back_btn.clicked.connect(self.return_to_menu)
         layout.addWidget(back_btn)
 
     def return_to_menu(self):
-        from ui.main_window import PhysicsCalculator
         if hasattr(self.parent(), 'parent') and hasattr(self.parent().parent(), 'return_to_menu'):
             self.parent().parent().return_to_menu()
 
     def validate_ai_response(self, response: str) -> str:
-        if "**Final Answer:**" not in response:
+        if _FINAL_MARKER not in response:
             return "ERROR: AI failed to follow the required format.\n\nRaw AI Output:\n" + response
         return response
 
@@ -165,76 +198,108 @@ class AIAssistantTab(QWidget):
             self.response_display.setPlainText("Please enter a question")
             return
 
-        # If model is not loaded, load it in background thread
+        # One question at a time; re-enabled once it is answered or fails
+        self._set_busy(True)
+
+        # If model is not loaded yet, answer the question once it is
         if self.mistral is None:
             self.response_display.setPlainText("Loading AI model... This may take a moment on first use.")
-            
-            # Stop any existing model loader
-            if self.model_loader and self.model_loader.isRunning():
-                self.model_loader.quit()
-                self.model_loader.wait()
-            
-            # Start model loading in background
-            self.model_loader = ModelLoaderWorker()
-            self.model_loader.finished.connect(self.on_model_loaded)
-            self.model_loader.error.connect(self.on_model_error)
-            self.model_loader.start()
+            self._pending_question = question
+            if not (self.model_loader and self.model_loader.isRunning()):
+                self._start_model_load()
             return
 
         # Model is loaded, proceed with question
         self.process_question(question)
 
+    def _start_model_load(self):
+        """Start loading the AI model in a background thread"""
+        self.model_loader = ModelLoaderWorker()
+        self.model_loader.finished.connect(self.on_model_loaded)
+        self.model_loader.error.connect(self.on_model_error)
+        self.model_loader.start()
+
     def on_model_loaded(self, model):
         """Called when AI model finishes loading"""
         self.mistral = model
-        self.response_display.setPlainText("AI model loaded! Processing your question...")
-        
-        # Now process the question that was waiting
-        question = self.question_input.toPlainText()
-        if question.strip():
+
+        # Now process the question that was waiting, if any
+        if self._pending_question is not None:
+            question, self._pending_question = self._pending_question, None
+            self.response_display.setPlainText("AI model loaded! Processing your question...")
             self.process_question(question)
 
     def on_model_error(self, error_msg):
         """Called when AI model loading fails"""
+        if self._pending_question is None:
+            # Background preload nobody is waiting on; the next question retries the load
+            logger.warning("Error loading AI model: %s", error_msg)
+            return
+        self._pending_question = None
         self.response_display.setPlainText(f"Error loading AI model: {error_msg}")
+        self._set_busy(False)
+
+    def _set_busy(self, busy):
+        """Lock the Solve button and freeze the animated background while a question is pending"""
+        self.submit_btn.setEnabled(not busy)
+        self.submit_btn.setText("Solving…" if busy else "Solve")
+        self.background.set_paused(busy)
 
     def process_question(self, question):
         """Process the question with the loaded model"""
-        if self.worker and self.worker.isRunning():
-            self.worker.quit()
-            self.worker.wait()
+        # Same question modulo case/spacing -> reuse the earlier answer
+        key = " ".join(question.lower().split())
+        if key in self._answer_cache:
+            self._answer_cache.move_to_end(key)
+            self.handle_response(self._answer_cache[key])
+            return
 
         try:
-            if self.worker and self.worker.isRunning():
-                self.worker.quit()
-                self.worker.wait()
             self.response_display.setPlainText("Processing...")
             self.worker = AIWorker(self.mistral, question)
-            self.worker.finished.connect(self.handle_response)
-            self.worker.error.connect(self.handle_error)
-            self.worker.start()
+            self.worker.signals.finished.connect(functools.partial(self.handle_response, key=key))
+            self.worker.signals.error.connect(self.handle_error)
+            _AI_POOL.start(self.worker)
         except Exception as e:
             self.response_display.setPlainText(f"Error: {str(e)}")
+            self._set_busy(False)
 
-    def handle_response(self, response):
+    def handle_response(self, response, key=None):
         validated = self.validate_ai_response(response)
+
+        # Only reuse well-formed answers; failed or malformed replies are retried next time
+        if key is not None and _FINAL_MARKER in response:
+            self._answer_cache[key] = response
+            self._answer_cache.move_to_end(key)
+            if len(self._answer_cache) > self.MAX_CACHE:
+                self._answer_cache.popitem(last=False)
+
         self.response_display.setPlainText(validated)
+        self._set_busy(False)
         self.worker = None
 
     def handle_error(self, error_msg):
         self.response_display.setPlainText(f"Error: {error_msg}")
+        self._set_busy(False)
         self.worker = None
 
+    def shutdown(self):
+        """Stop background AI work before the tab goes away"""
+        # Drop questions that haven't started and keep a late answer from reaching this tab
+        _AI_POOL.clear()
+        if self.worker is not None:
+            self.worker.signals.finished.disconnect()
+            self.worker.signals.error.disconnect()
+            self.worker = None
+        if self.model_loader and self.model_loader.isRunning():
+            self.model_loader.quit()
+            self.model_loader.wait()
+        # A request already sent can't be cancelled; wait briefly rather than block exit
+        _AI_POOL.waitForDone(_AI_EXIT_WAIT_MS)
+
     def closeEvent(self, event):
         try:
-            if self.worker and self.worker.isRunning():
-                self.worker.quit()
-                self.worker.wait()
-                self.worker = None
-
-            if self.model_loader and self.model_loader.isRunning():
-                self.model_loader.quit()
-                self.model_loader.wait()
+            self.shutdown()
         except Exception as e:
             print(f"Error during closeEvent: {e}")
         event.accept()
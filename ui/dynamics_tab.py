@@ -2,17 +2,87 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                             QLineEdit, QPushButton, QGroupBox, QFormLayout,
                             QMessageBox, QComboBox, QTabWidget)
 from PyQt6.QtCore import Qt
-import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
 import numpy as np
 from core.dynamics import solve_dynamics
 from PyQt6.QtGui import QFont, QColor
 from matplotlib.patches import ArrowStyle
 import math
+import functools
+
+# Sample grid shared by every plot, scaled per call
+_UNIT_T = np.linspace(0.0, 1.0, 100)
+
+TAB_STYLE = """
+    QWidget {
+        background-color: #222222;
+        color: #EEEEEE;
+        font-family: Segoe UI, Arial;
+    }
+    QGroupBox {
+        font: bold 14px;
+        border: 2px solid #3A7CA5;
+        border-radius: 5px;
+        margin-top: 1ex;
+        background-color: #333333;
+        padding-top: 12px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 3px;
+        color: #3A7CA5;
+    }
+    QPushButton {
+        background-color: #3A7CA5;
+        color: white;
+        border: none;
+        padding: 6px 12px;
+        border-radius: 4px;
+        font-weight: bold;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #2F6690;
+    }
+    QPushButton:disabled {
+        background-color: #666666;
+    }
+    QLineEdit, QComboBox {
+        border: 1px solid #3A7CA5;
+        padding: 5px;
+        border-radius: 3px;
+        background-color: #444444;
+        color: white;
+        selection-background-color: #3A7CA5;
+    }
+    QLabel {
+        color: #EEEEEE;
+        font-size: 13px;
+    }
+"""
+
+def _maybe_float(text):
+    """Parse a field's text, giving None for blank or non-numeric input"""
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+@functools.lru_cache(maxsize=128)
+def _incline_forces(m, theta):
+    """(normal, parallel) weight components for mass m on a theta° incline"""
+    rad = math.radians(theta)
+    return m * 9.81 * math.cos(rad), m * 9.81 * math.sin(rad)
 
 class BasePhysicsTab(QWidget):
-    def __init__(self, title, parent=None):
+    def __init__(self, title, parent=None, canvas=None):
         super().__init__(parent)
+        self.canvas = canvas  # shared canvas from DynamicsTab, if any
         self.dark_mode = False
         self.last_result = None
         self.title = title
@@ -48,9 +118,12 @@ class BasePhysicsTab(QWidget):
         input_layout.addRow(button_layout)
         input_layout.addRow(self.result_display)
         
-        # Right panel for plot
-        self.figure, self.ax = plt.subplots()
-        self.canvas = FigureCanvas(self.figure)
+        # Right panel for plot; with a shared canvas this tab gets its own axes on it
+        if self.canvas is None:
+            self.canvas = FigureCanvas(Figure())
+        self.figure = self.canvas.figure
+        self.ax = self.figure.add_subplot(111)
+        self.create_artists()
         
         # Add panels to main layout
         input_panel.setLayout(input_layout)
@@ -65,55 +138,32 @@ class BasePhysicsTab(QWidget):
         """To be implemented by subclasses"""
         pass
     
+    def create_artists(self):
+        """To be implemented by subclasses: build the plot's artists once, hidden.
+        plot() then only updates their data instead of rebuilding the axes.
+        Lines are added with scalex/scaley off so the empty axes keep their 0-1 view."""
+        self.plot_artists = []
+    
+    def hide_artists(self):
+        for artist in self.plot_artists:
+            artist.set_visible(False)
+    
+    def show_artists(self, shown):
+        """Show only the given artists, with a legend for the labelled ones"""
+        for artist in self.plot_artists:
+            artist.set_visible(artist in shown)
+        self.ax.legend(handles=[a for a in shown if a.get_label() and not a.get_label().startswith('_')])
+        self.canvas.draw_idle()
+    
     def apply_style(self):
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #222222;
-                color: #EEEEEE;
-                font-family: Segoe UI, Arial;
-            }
-            QGroupBox {
-                font: bold 14px;
-                border: 2px solid #3A7CA5;
-                border-radius: 5px;
-                margin-top: 1ex;
-                background-color: #333333;
-                padding-top: 12px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 3px;
-                color: #3A7CA5;
-            }
-            QPushButton {
-                background-color: #3A7CA5;
-                color: white;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 4px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #2F6690;
-            }
-            QPushButton:disabled {
-                background-color: #666666;
-            }
-            QLineEdit, QComboBox {
-                border: 1px solid #3A7CA5;
-                padding: 5px;
-                border-radius: 3px;
-                background-color: #444444;
-                color: white;
-                selection-background-color: #3A7CA5;
-            }
-            QLabel {
-                color: #EEEEEE;
-                font-size: 13px;
-            }
-        """)
+        # Widget styling comes from TAB_STYLE, set once on DynamicsTab
+        self.update_plot_theme()
+    
+    def activate(self):
+        """Take over the shared canvas: move it into this tab and show only our axes"""
+        for ax in self.figure.axes:
+            ax.set_visible(ax is self.ax)
+        self.layout().addWidget(self.canvas, 1)
         self.update_plot_theme()
     
     def update_plot_theme(self):
@@ -129,7 +179,7 @@ class BasePhysicsTab(QWidget):
             for text in [self.ax.title, self.ax.xaxis.label, self.ax.yaxis.label] + self.ax.texts:
                 text.set_color('#333333')
             self.ax.grid(color='#DDDDDD')
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def connect_signals(self):
         self.calculate_btn.clicked.connect(self.calculate)
@@ -148,25 +198,15 @@ class BasePhysicsTab(QWidget):
             result = solve_dynamics(**values)
             self.last_result = result
             
-            result_text = "📊 Results:\n"
-            for var, val in result.items():
-                if val is not None:
-                    result_text += f"• {var}: {val:.3f}\n"
-            
-            self.result_display.setText(result_text)
+            lines = ["📊 Results:"]
+            lines.extend(f"• {var}: {val:.3f}" for var, val in result.items() if val is not None)
+            self.result_display.setText("\n".join(lines))
             
         except Exception as e:
             QMessageBox.critical(self, "Calculation Error", f"An error occurred:\n{str(e)}")
     
     def get_input_values(self):
-        values = {}
-        for var, field in self.inputs.items():
-            text = field.text().strip()
-            try:
-                values[var] = float(text) if text else None
-            except ValueError:
-                values[var] = None
-        return values
+        return {var: _maybe_float(field.text()) for var, field in self.inputs.items()}
     
     def clear_fields(self):
         for field in self.inputs.values():
@@ -174,16 +214,17 @@ class BasePhysicsTab(QWidget):
         self.result_display.setText("Results will appear here...")
         self.last_result = None
         self.ax.clear()
+        self.create_artists()
         self.update_plot_theme()
-        self.canvas.draw()
     
     def plot(self):
         """To be implemented by subclasses"""
         pass
 
 class ForceMomentumTab(BasePhysicsTab):
-    def __init__(self, parent=None):
-        super().__init__("Force & Momentum Calculator", parent)
+    def __init__(self, parent=None, canvas=None):
+        super().__init__("Force & Momentum Calculator", parent, canvas)
+        self._cached_t_max = None  # t_max the time grids below were built for
     
     def create_input_fields(self, layout):
         units = {
@@ -217,6 +258,29 @@ class ForceMomentumTab(BasePhysicsTab):
             layout.addRow(symbols[var], hbox)
             self.unit_combos[var] = unit_combo
     
+    def create_artists(self):
+        self.displacement_line, = self.ax.plot([], [], color='#2E86AB', linewidth=2, label='Displacement (m)',
+                                               scalex=False, scaley=False)
+        self.velocity_line, = self.ax.plot([], [], color='#D62246', linewidth=2, label='Velocity (m/s)',
+                                           scalex=False, scaley=False)
+        self.acceleration_line, = self.ax.plot([], [], color='#4CB944', linewidth=2, label='Acceleration',
+                                               scalex=False, scaley=False)
+        
+        # Motion arrows at the end of the displacement and velocity curves
+        arrow_props = dict(
+            arrowstyle=ArrowStyle.CurveFilledB(head_length=0.4, head_width=0.2),
+            color='#2E86AB', linewidth=0
+        )
+        self.displacement_arrow = self.ax.annotate('', xy=(0, 0), xytext=(0, 0), arrowprops=arrow_props)
+        arrow_props['color'] = '#D62246'
+        self.velocity_arrow = self.ax.annotate('', xy=(0, 0), xytext=(0, 0), arrowprops=arrow_props)
+        
+        self.info_text = self.ax.text(0.02, 0.95, '', transform=self.ax.transAxes,
+                                      bbox=dict(facecolor='white', alpha=0.8, edgecolor='none'))
+        self.plot_artists = [self.displacement_line, self.velocity_line, self.acceleration_line,
+                             self.displacement_arrow, self.velocity_arrow, self.info_text]
+        self.hide_artists()
+    
     def plot(self):
         if not self.last_result:
             QMessageBox.warning(self, "No Data", "Please calculate first before plotting.")
@@ -235,46 +299,37 @@ class ForceMomentumTab(BasePhysicsTab):
         if result.get('t') is not None:
             t_max = max(1, result['t'] * 1.5)
         
-        time = np.linspace(0, t_max, 100)
+        # The time grid and its square only depend on t_max; rebuild them only when it changes
+        if t_max != self._cached_t_max:
+            self._time = np.linspace(0, t_max, 100)
+            self._time_sq = self._time**2
+            self._cached_t_max = t_max
+        time = self._time
         
         # Calculate motion
         v = a * time
-        s = 0.5 * a * time**2
+        s = 0.5 * a * self._time_sq
         
-        # Clear and style plot
-        self.ax.clear()
-        self.update_plot_theme()
+        # Update motion curves
+        self.displacement_line.set_data(time, s)
+        self.velocity_line.set_data(time, v)
+        self.acceleration_line.set_data(time, np.full_like(time, a))
+        self.acceleration_line.set_label(f'Acceleration ({a:.2f} m/s²)')
         
-        # Plot motion
-        line_s = self.ax.plot(time, s, color='#2E86AB', linewidth=2, label='Displacement (m)')
-        line_v = self.ax.plot(time, v, color='#D62246', linewidth=2, label='Velocity (m/s)')
-        line_a = self.ax.plot(time, [a]*len(time), color='#4CB944', linewidth=2, 
-                            label=f'Acceleration ({a:.2f} m/s²)')
-        
-        # Add motion arrows
-        if len(time) > 1:
-            arrow_props = dict(
-                arrowstyle=ArrowStyle.CurveFilledB(head_length=0.4, head_width=0.2),
-                color='#2E86AB', linewidth=0
-            )
-            self.ax.annotate('', xy=(time[-1], s[-1]), 
-                           xytext=(time[-2], s[-2]),
-                           arrowprops=arrow_props)
-            
-            arrow_props['color'] = '#D62246'
-            self.ax.annotate('', xy=(time[-1], v[-1]), 
-                           xytext=(time[-2], v[-2]),
-                           arrowprops=arrow_props)
+        # Move motion arrows
+        self.displacement_arrow.xy = (time[-1], s[-1])
+        self.displacement_arrow.xyann = (time[-2], s[-2])
+        self.velocity_arrow.xy = (time[-1], v[-1])
+        self.velocity_arrow.xyann = (time[-2], v[-2])
         
-        # Add annotations
-        self.ax.text(0.02, 0.95, f"F = {F:.2f} N\nm = {m:.2f} kg", transform=self.ax.transAxes,
-                    bbox=dict(facecolor='white' if not self.dark_mode else '#444444',
-                             alpha=0.8, edgecolor='none'))
+        # Update annotation
+        self.info_text.set_text(f"F = {F:.2f} N\nm = {m:.2f} kg")
+        self.info_text.get_bbox_patch().set_facecolor('white' if not self.dark_mode else '#444444')
         
         # Set axis limits
         x_padding = t_max * 0.1
-        y_min = min(min(s), min(v), 0) - 1
-        y_max = max(max(s), max(v), a) + 1
+        y_min = min(s.min(), v.min(), 0) - 1
+        y_max = max(s.max(), v.max(), a) + 1
         
         self.ax.set_xlim(0 - x_padding, t_max + x_padding)
         self.ax.set_ylim(y_min, y_max)
@@ -283,14 +338,11 @@ class ForceMomentumTab(BasePhysicsTab):
         self.ax.set_xlabel('Time (s)')
         self.ax.set_ylabel('Value')
         self.ax.set_title('Motion Under Constant Force')
-        self.ax.legend()
-        self.ax.grid(True)
-        
-        self.canvas.draw()
+        self.show_artists(self.plot_artists)
 
 class FrictionTab(BasePhysicsTab):
-    def __init__(self, parent=None):
-        super().__init__("Friction Calculator", parent)
+    def __init__(self, parent=None, canvas=None):
+        super().__init__("Friction Calculator", parent, canvas)
     
     def create_input_fields(self, layout):
         units = {
@@ -318,6 +370,14 @@ class FrictionTab(BasePhysicsTab):
             layout.addRow(symbols[var], hbox)
             self.unit_combos[var] = unit_combo
     
+    def create_artists(self):
+        self.friction_line, = self.ax.plot([], [], color='#D62246', linewidth=2, label='Friction Force',
+                                           scalex=False, scaley=False)
+        self.info_text = self.ax.text(0.02, 0.95, '', transform=self.ax.transAxes,
+                                      bbox=dict(facecolor='white', alpha=0.8, edgecolor='none'))
+        self.plot_artists = [self.friction_line, self.info_text]
+        self.hide_artists()
+    
     def plot(self):
         if not self.last_result:
             QMessageBox.warning(self, "No Data", "Please calculate first before plotting.")
@@ -332,22 +392,16 @@ class FrictionTab(BasePhysicsTab):
         mu, FN = result['mu'], result['FN']
         
         # Create normal force range
-        FN_range = np.linspace(0, FN * 1.5, 100)
-        Ffriction = mu * FN_range
+        FN_range = _UNIT_T * (FN * 1.5)
+        Ffriction = FN_range * mu
         
-        # Clear and style plot
-        self.ax.clear()
-        self.update_plot_theme()
-        
-        # Plot friction
-        self.ax.plot(FN_range, Ffriction, color='#D62246', linewidth=2, 
-                    label=f'Friction Force (μ = {mu:.2f})')
+        # Update friction line
+        self.friction_line.set_data(FN_range, Ffriction)
+        self.friction_line.set_label(f'Friction Force (μ = {mu:.2f})')
         
-        # Add annotations
-        self.ax.text(0.02, 0.95, f"Fₙ = {FN:.2f} N\nFf = {mu*FN:.2f} N", 
-                    transform=self.ax.transAxes,
-                    bbox=dict(facecolor='white' if not self.dark_mode else '#444444',
-                             alpha=0.8, edgecolor='none'))
+        # Update annotation
+        self.info_text.set_text(f"Fₙ = {FN:.2f} N\nFf = {mu*FN:.2f} N")
+        self.info_text.get_bbox_patch().set_facecolor('white' if not self.dark_mode else '#444444')
         
         # Set axis limits
         self.ax.set_xlim(0, FN * 1.5)
@@ -357,14 +411,11 @@ class FrictionTab(BasePhysicsTab):
         self.ax.set_xlabel('Normal Force (N)')
         self.ax.set_ylabel('Friction Force (N)')
         self.ax.set_title('Friction Force vs Normal Force')
-        self.ax.legend()
-        self.ax.grid(True)
-        
-        self.canvas.draw()
+        self.show_artists(self.plot_artists)
 
 class InclinedPlaneTab(BasePhysicsTab):
-    def __init__(self, parent=None):
-        super().__init__("Inclined Plane Calculator", parent)
+    def __init__(self, parent=None, canvas=None):
+        super().__init__("Inclined Plane Calculator", parent, canvas)
     
     def create_input_fields(self, layout):
         units = {
@@ -396,6 +447,15 @@ class InclinedPlaneTab(BasePhysicsTab):
             layout.addRow(symbols[var], hbox)
             self.unit_combos[var] = unit_combo
     
+    def create_artists(self):
+        self.normal_line = self.ax.axhline(0, color='#2E86AB', linewidth=2, label='Normal Force')
+        self.parallel_line = self.ax.axhline(0, color='#D62246', linewidth=2, label='Parallel Force')
+        self.ax.set_ylim(0, 1)  # Keep the empty axes' default view rather than autoscaling around y=0
+        self.info_text = self.ax.text(0.02, 0.95, '', transform=self.ax.transAxes,
+                                      bbox=dict(facecolor='white', alpha=0.8, edgecolor='none'))
+        self.plot_artists = [self.normal_line, self.parallel_line, self.info_text]
+        self.hide_artists()
+    
     def plot(self):
         if not self.last_result:
             QMessageBox.warning(self, "No Data", "Please calculate first before plotting.")
@@ -410,22 +470,15 @@ class InclinedPlaneTab(BasePhysicsTab):
         m, theta = result['m'], result['theta']
         
         # Calculate components
-        Fnormal = m * 9.81 * math.cos(math.radians(theta))
-        Fparallel = m * 9.81 * math.sin(math.radians(theta))
-        
-        # Clear and style plot
-        self.ax.clear()
-        self.update_plot_theme()
+        Fnormal, Fparallel = _incline_forces(m, theta)
         
-        # Plot components
-        self.ax.plot([0, 90], [Fnormal, Fnormal], color='#2E86AB', linewidth=2, label='Normal Force')
-        self.ax.plot([0, 90], [Fparallel, Fparallel], color='#D62246', linewidth=2, label='Parallel Force')
+        # Update components
+        self.normal_line.set_ydata([Fnormal, Fnormal])
+        self.parallel_line.set_ydata([Fparallel, Fparallel])
         
-        # Add annotations
-        self.ax.text(0.02, 0.95, f"Fₙ = {Fnormal:.2f} N\nF∥ = {Fparallel:.2f} N", 
-                    transform=self.ax.transAxes,
-                    bbox=dict(facecolor='white' if not self.dark_mode else '#444444',
-                             alpha=0.8, edgecolor='none'))
+        # Update annotation
+        self.info_text.set_text(f"Fₙ = {Fnormal:.2f} N\nF∥ = {Fparallel:.2f} N")
+        self.info_text.get_bbox_patch().set_facecolor('white' if not self.dark_mode else '#444444')
         
         # Set axis limits
         self.ax.set_xlim(0, 90)
@@ -435,10 +488,7 @@ class InclinedPlaneTab(BasePhysicsTab):
         self.ax.set_xlabel('Angle (°)')
         self.ax.set_ylabel('Force (N)')
         self.ax.set_title('Force Components on an Inclined Plane')
-        self.ax.legend()
-        self.ax.grid(True)
-        
-        self.canvas.draw()
+        self.show_artists(self.plot_artists)
 
 class DynamicsTab(QWidget):
     def __init__(self):
@@ -466,17 +516,23 @@ class DynamicsTab(QWidget):
         """)
         layout.addWidget(return_btn)
         
-        # Create tab widget
+        # Create tab widget; its stylesheet is inherited by every sub-tab
         self.tabs = QTabWidget()
+        self.tabs.setStyleSheet(TAB_STYLE)
+        
+        # One canvas for all sub-tabs, moved into whichever is showing
+        self.canvas = FigureCanvas(Figure())
         
         # Create and add sub-tabs
-        self.force_momentum_tab = ForceMomentumTab()
-        self.friction_tab = FrictionTab()
-        self.inclined_plane_tab = InclinedPlaneTab()
+        self.force_momentum_tab = ForceMomentumTab(canvas=self.canvas)
+        self.friction_tab = FrictionTab(canvas=self.canvas)
+        self.inclined_plane_tab = InclinedPlaneTab(canvas=self.canvas)
         
         self.tabs.addTab(self.force_momentum_tab, "Force and Momentum")
         self.tabs.addTab(self.friction_tab, "Friction")
         self.tabs.addTab(self.inclined_plane_tab, "Inclined Plane")
+        self.show_tab(0)
+        self.tabs.currentChanged.connect(self.show_tab)
         
         layout.addWidget(self.tabs)
         self.setLayout(layout)
@@ -484,5 +540,9 @@ class DynamicsTab(QWidget):
         # Connect return button
         return_btn.clicked.connect(self.return_to_menu)
     
+    def show_tab(self, index):
+        if index >= 0:
+            self.tabs.widget(index).activate()
+    
     def return_to_menu(self):
         self.parent().parent().return_to_menu()
\ No newline at end of file
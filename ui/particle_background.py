@@ -1,55 +1,51 @@
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import QTimer, QPoint
-from PyQt6.QtGui import QPainter, QPen, QBrush, QColor
+from PyQt6.QtCore import QTimer, QPoint, Qt
+from PyQt6.QtGui import QPainter, QPen, QBrush, QColor, QPixmap
 import random, math
+import numpy as np
 
 class ParticleBackground(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.particles = []
+        self.grid_pixmap = None
         self.initParticles(20)
+        self.paused = False
+        # Only animates while shown; started from showEvent
         self.timer = QTimer(self)
+        self.timer.setInterval(60)
         self.timer.timeout.connect(self.updateParticles)
-        self.timer.start(60)
 
     def initParticles(self, count):
-        for _ in range(count):
-            size = random.uniform(1, 2.5)
-            speed = random.uniform(0.3, 1.2)
-            self.particles.append({
-                'x': random.uniform(0, self.width()),
-                'y': random.uniform(0, self.height()),
-                'size': size,
-                'speed': speed,
-                'direction': random.uniform(0, 2 * math.pi),
-                'color': QColor(79, 195, 247, random.randint(40, 100))
-            })
+        # One array per particle property so each tick is a handful of array ops
+        self.count = count
+        self.px = np.random.uniform(0, self.width(), count)
+        self.py = np.random.uniform(0, self.height(), count)
+        self.psize = np.random.uniform(1, 2.5, count)
+        self.pspeed = np.random.uniform(0.3, 1.2, count)
+        self.pdir = np.random.uniform(0, 2 * math.pi, count)
+        # Per-tick velocity, only recomputed for particles that change direction
+        self.vx = np.cos(self.pdir) * self.pspeed
+        self.vy = np.sin(self.pdir) * self.pspeed
+        self.colors = [QColor(79, 195, 247, random.randint(40, 100)) for _ in range(count)]
+        # Pens, brushes and radii never change, so build them once rather than every frame
+        self.pens = [QPen(color, size) for color, size in zip(self.colors, self.psize.tolist())]
+        self.brushes = [QBrush(color) for color in self.colors]
+        self.radii = self.psize.astype(int).tolist()
 
     def resizeEvent(self, event):
-        for p in self.particles:
-            p['x'] = random.uniform(0, self.width())
-            p['y'] = random.uniform(0, self.height())
+        self.px = np.random.uniform(0, self.width(), self.count)
+        self.py = np.random.uniform(0, self.height(), self.count)
+        self.grid_pixmap = None  # Rebuilt at the new size on the next paint
         super().resizeEvent(event)
 
-    def updateParticles(self):
-        for p in self.particles:
-            p['x'] += math.cos(p['direction']) * p['speed']
-            p['y'] += math.sin(p['direction']) * p['speed']
-            if p['x'] < 0: p['x'] = self.width()
-            if p['x'] > self.width(): p['x'] = 0
-            if p['y'] < 0: p['y'] = self.height()
-            if p['y'] > self.height(): p['y'] = 0
-            if random.random() < 0.015:
-                p['direction'] += random.uniform(-0.3, 0.3)
-        self.update()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def buildGridPixmap(self):
+        """Draw the static grid once into a pixmap that paintEvent can blit"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(round(self.width() * ratio), round(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        for p in self.particles:
-            painter.setPen(QPen(p['color'], p['size']))
-            painter.setBrush(QBrush(p['color']))
-            painter.drawEllipse(QPoint(int(p['x']), int(p['y'])), int(p['size']), int(p['size']))
         pen = QPen(QColor(200, 200, 200, 15))
         pen.setWidth(1)
         painter.setPen(pen)
@@ -59,3 +55,60 @@ class ParticleBackground(QWidget):
         for y in range(0, self.height(), grid_size):
             painter.drawLine(0, y, self.width(), y)
         painter.end()
+        return pixmap
+
+    def updateParticles(self):
+        w, h = self.width(), self.height()
+        self.px += self.vx
+        self.py += self.vy
+        self.px[self.px < 0] = w
+        self.px[self.px > w] = 0
+        self.py[self.py < 0] = h
+        self.py[self.py > h] = 0
+        turn = np.random.random(self.count) < 0.015
+        if turn.any():
+            self.pdir[turn] += np.random.uniform(-0.3, 0.3, np.count_nonzero(turn))
+            self.vx[turn] = np.cos(self.pdir[turn]) * self.pspeed[turn]
+            self.vy[turn] = np.sin(self.pdir[turn]) * self.pspeed[turn]
+        self.update()
+
+    def set_paused(self, paused):
+        """Stop or restart the animation timer"""
+        self.paused = paused
+        if paused:
+            self.timer.stop()
+        elif self.isVisible():
+            self.timer.start()
+
+    def showEvent(self, event):
+        if not self.paused:
+            self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        # Covers the parent page being switched away from in a QStackedWidget too
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Only touch particles and grid lines inside the area Qt asked to repaint
+        dirty = event.rect()
+        left, top, right, bottom = dirty.left(), dirty.top(), dirty.right(), dirty.bottom()
+        reach = self.psize * 2  # Radius plus half the pen width, rounded up
+        visible = np.flatnonzero(
+            (self.px + reach >= left) & (self.px - reach <= right) &
+            (self.py + reach >= top) & (self.py - reach <= bottom)
+        )
+        xs = self.px.astype(int)
+        ys = self.py.astype(int)
+        for i in visible.tolist():
+            r = self.radii[i]
+            painter.setPen(self.pens[i])
+            painter.setBrush(self.brushes[i])
+            painter.drawEllipse(QPoint(int(xs[i]), int(ys[i])), r, r)
+        if self.grid_pixmap is None:
+            self.grid_pixmap = self.buildGridPixmap()
+        painter.drawPixmap(0, 0, self.grid_pixmap)
+        painter.end()
@@ -7,6 +7,9 @@ from PyQt6.QtGui import QFont, QColor
 from ui.particle_background import ParticleBackground
 from ui.qr_code_dialog import QRCodeDialog
 
+USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9_.]+$')
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+
 
 class SignupDialog(QDialog):
     def __init__(self, auth_manager):
@@ -89,11 +92,11 @@ class SignupDialog(QDialog):
             self.error_label.setText("All fields are required.")
             return
 
-        if len(username) < 3 or not re.match(r'^[a-zA-Z0-9_.]+$', username):
+        if len(username) < 3 or not USERNAME_PATTERN.match(username):
             self.error_label.setText("Username must be 3+ chars (letters, numbers, _, . only).")
             return
 
-        if not re.match(r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$", email):
+        if not EMAIL_PATTERN.match(email):
             self.error_label.setText("Invalid email format.")
             return
 